@@ -1,8 +1,12 @@
+import io
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
@@ -13,12 +17,17 @@ load_dotenv()
 
 from data_access import (
     load_trades_df, load_volume_by_year_df, load_all_trades_df, load_portfolio_curve,
-    load_all_portfolio_curves,
+    load_all_portfolio_curves, load_kpis, load_daily_volume,
     load_lobbying_df, load_lobbying_top_spenders,
     load_gov_contracts_df, load_gov_contracts_top_recipients,
     load_activist_filings_df, load_market_intelligence_overlap, load_ticker_timeline,
+    warm_up_db,
 )
 
+# Open a pooled DB connection once per worker process at import time, so
+# the TCP+TLS+login handshake doesn't land on the first user interaction.
+warm_up_db()
+
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -182,17 +191,53 @@ def _compute_pnl(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+# --- WIDGET OPTION HELPER ---
+
+@st.cache_data(show_spinner=False)
+def _filter_options(df: pd.DataFrame) -> dict:
+    """Precompute the unique option lists backing filter widgets.
+
+    Every widget interaction reruns the whole script, so computing
+    sorted-unique scans inline re-walks the full DataFrame each time.
+    Cached on the DataFrame hash, the scans run once per distinct frame.
+    """
+    return {
+        "chambers": tuple(sorted(df["Chamber"].dropna().unique())) if "Chamber" in df.columns else (),
+        "parties": tuple(sorted(df["Party"].dropna().unique())) if "Party" in df.columns else (),
+        "senators": tuple(sorted(df["Senator"].dropna().unique())) if "Senator" in df.columns else (),
+    }
+
+
+# --- CSV EXPORT HELPER ---
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV bytes for st.download_button.
+
+    Streamlit evaluates the ``data=`` arg on every rerun, so without
+    caching the CSV would be rebuilt on each widget interaction even if
+    the button is never clicked. Cached on the DataFrame hash, and uses
+    pyarrow's CSV writer which is much faster than pandas' Python-level
+    one.
+    """
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue()
+
+
 # --- DATA LOADER (REAL PTR TRADES FROM DB) ---
 
-@st.cache_data(
-    ttl=60 * 60,  # 60 minutes
-    show_spinner="Loading latest PTR trades from database... contact @justin.cheong@u.nus.edu if this fails",
-)
+@st.cache_data(ttl=60 * 60, show_spinner=False)
 def get_trades_data(days: int = 365) -> pd.DataFrame:
     """Load and transform PTR trades from the database for the dashboard.
 
     This reshapes the raw DB columns to match the names expected by the
     existing UI so the rest of the app code can remain largely unchanged.
+
+    Two cache layers: ``load_trades_df`` disk-persists the raw DB read,
+    and this wrapper is cached too because the reshaping on top of it
+    (P&L matching, categorical encoding, the final sort) is far from
+    free and would otherwise rerun on every widget interaction.
     """
 
     df = load_trades_df(days=days)
@@ -219,8 +264,12 @@ def get_trades_data(days: int = 365) -> pd.DataFrame:
     if "owner" in df.columns and "Owner" not in df.columns:
         df["Owner"] = df["owner"].fillna("")
 
-    # Derive unusual flag based on mid-point value
-    df["Unusual"] = df["Mid Point"] > 100_000
+    # Unusual flag is persisted at ingest time; fall back to deriving it
+    # for frames loaded without the column (e.g. SELECT * paths).
+    if "unusual" in df.columns:
+        df["Unusual"] = df["unusual"] == 1
+    else:
+        df["Unusual"] = df["Mid Point"] > 100_000
 
     # Temporary party mapping (to be replaced with a senators metadata join)
     if "Party" not in df.columns:
@@ -252,9 +301,54 @@ def get_trades_data(days: int = 365) -> pd.DataFrame:
         df = df[~df["Ticker"].isin(["--", "", None])]
 
     df = _compute_pnl(df)
+
+    # Uppercased ticker column precomputed once so the Live Feed search
+    # doesn't re-uppercase the whole column on every keystroke rerun.
+    if "Ticker" in df.columns:
+        df["Ticker_upper"] = df["Ticker"].str.upper()
+
+    # Dictionary-encode the low-cardinality string columns. A few hundred
+    # distinct senators/tickers (and ~6 amount buckets) across thousands
+    # of rows means category codes are far smaller than per-row Python
+    # strings, isin/groupby operate on the integer codes, and the frame
+    # pickles into Streamlit's cache proportionally faster.
+    cat_cols = {
+        c: "category"
+        for c in (
+            "Senator", "Type", "Chamber", "Ticker", "Ticker_upper",
+            "Amount Range", "Owner", "Sector", "transaction_type_raw",
+        )
+        if c in df.columns
+    }
+    if cat_cols:
+        df = df.astype(cat_cols)
+
+    # Sort once here (the cached reshaping path) so render code can rely
+    # on newest-filing-first order; boolean masking preserves it, sparing
+    # the Live Feed an O(n log n) sort on every widget rerun.
+    if "Filing Date" in df.columns:
+        df = df.sort_values("Filing Date", ascending=False, kind="stable").reset_index(drop=True)
     return df
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def get_trades_by_chamber(days: int = 365) -> dict:
+    """Partition the dashboard frame by Chamber, cached once.
+
+    The global Chamber filter used to run a boolean mask + full copy over
+    the whole frame on every rerun of every page. Chamber has a handful
+    of distinct values, so partitioning once and concatenating the
+    selected pieces is far cheaper per rerun.
+    """
+    df = get_trades_data(days)
+    if df.empty or "Chamber" not in df.columns:
+        return {}
+    return {
+        chamber: group.reset_index(drop=True)
+        for chamber, group in df.groupby("Chamber", observed=True)
+    }
+
+
 @st.cache_data(ttl=60 * 60)
 def get_volume_by_year_data() -> pd.DataFrame:
     """Load and prepare all-time trade data for the volume by year chart."""
@@ -262,7 +356,9 @@ def get_volume_by_year_data() -> pd.DataFrame:
     if df.empty:
         return df
 
-    df["Transaction Date"] = pd.to_datetime(df["transaction_date"])
+    # transaction_date already arrives as datetime64 via parse_dates, so
+    # .dt.year runs on the int64-backed fast path.
+    df["Transaction Date"] = df["transaction_date"]
     df["Year"] = df["Transaction Date"].dt.year
     df["Type"] = df["transaction_type"].str.upper()
     df["Mid Point"] = pd.to_numeric(df["mid_point"], errors="coerce")
@@ -328,7 +424,7 @@ with st.sidebar:
 
     # Global Chamber filter; currently will just show ["Senate"], but is
     # ready for ["Senate", "House"] once House data is ingested.
-    chambers = sorted(df["Chamber"].dropna().unique().tolist()) if "Chamber" in df.columns else []
+    chambers = list(_filter_options(df)["chambers"])
     selected_chambers = st.multiselect(
         "Chamber",
         options=chambers,
@@ -344,9 +440,21 @@ with st.sidebar:
     st.markdown("---")
     st.info("Data refreshed every 24h via GitHub Actions.")
 
-# Apply Chamber filter globally so all pages respect it
-if selected_chambers:
-    df = df[df["Chamber"].isin(selected_chambers)]
+# Apply Chamber filter globally so all pages respect it. Selecting from
+# the cached per-chamber partitions avoids re-masking (and copying) the
+# whole frame on every rerun; concat only happens with >1 chamber picked.
+chambers_map = get_trades_by_chamber(365)
+parts = [chambers_map[c] for c in selected_chambers if c in chambers_map]
+if len(parts) > 1:
+    # Each partition is newest-filing-first; restore the global order the
+    # render code relies on after stitching chambers back together.
+    df = (
+        pd.concat(parts, copy=False, ignore_index=True)
+        .sort_values("Filing Date", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+elif parts:
+    df = parts[0]
 else:
     # If user deselects everything, show an empty dataset
     df = df.iloc[0:0]
@@ -359,25 +467,27 @@ if page == "Executive Dashboard":
     # KPI Row
     col1, col2, col3, col4 = st.columns(4)
 
-    total_vol = df["Mid Point"].sum()
-    # Types in the DB are normalized to BUY/SELL/EXCHANGE by the scraper,
-    # so we aggregate on those canonical values here.
-    buy_vol = df[df["Type"] == "BUY"]["Mid Point"].sum()
-    sell_vol = df[df["Type"] == "SELL"]["Mid Point"].sum()
-    unusual_count = df[df["Unusual"] == True].shape[0]
-    total_trades = len(df)
+    # KPIs are aggregated in SQL (one round trip, scalar results) instead
+    # of reducing the full row-level DataFrame in pandas. Types in the DB
+    # are normalized to BUY/SELL/EXCHANGE by the scraper, so the query
+    # aggregates on those canonical values.
+    kpis = load_kpis(365, tuple(selected_chambers))
+
+    total_vol = kpis["total_volume"]
+    buy_vol = kpis["buy_volume"]
+    sell_vol = kpis["sell_volume"]
+    unusual_count = kpis["unusual_count"]
+    total_trades = kpis["total_trades"]
 
     # Additional summary stats
-    buy_trades = df[df["Type"] == "BUY"]
-    sell_trades = df[df["Type"] == "SELL"]
     buy_sell_ratio = (
-        len(buy_trades) / len(sell_trades)
-        if len(sell_trades) > 0
-        else float("inf") if len(buy_trades) > 0
+        kpis["buy_trades"] / kpis["sell_trades"]
+        if kpis["sell_trades"] > 0
+        else float("inf") if kpis["buy_trades"] > 0
         else 0.0
     )
 
-    vol_by_senator = df.groupby("Senator")["Mid Point"].sum()
+    vol_by_senator = df.groupby("Senator", observed=True)["Mid Point"].sum()
     most_active_senator = vol_by_senator.idxmax() if not vol_by_senator.empty else "—"
     most_active_senator_vol = vol_by_senator.max() if not vol_by_senator.empty else 0.0
     
@@ -417,7 +527,7 @@ if page == "Executive Dashboard":
     # Placeholder for future KPI (e.g. most active party or sector)
     with kpi2_col4:
         top_sector = (
-            df.groupby("Sector")["Mid Point"].sum().idxmax()
+            df.groupby("Sector", observed=True)["Mid Point"].sum().idxmax()
             if "Sector" in df.columns and not df["Sector"].empty
             else "—"
         )
@@ -433,28 +543,43 @@ if page == "Executive Dashboard":
     
     with c1:
         # Time Series
-        # Filter for the last 365 days of Transaction Dates to keep the x-axis clean
-        cutoff_date = (pd.to_datetime('today') - pd.DateOffset(days=365)).date()
-        # Convert to datetime series to support comparison
-        transaction_dates = pd.to_datetime(df["Transaction Date"]).dt.date
-        recent_df = df[transaction_dates >= cutoff_date]
-        
-        time_df = recent_df.groupby("Transaction Date")["Mid Point"].sum().reset_index()
-        fig_time = px.area(time_df, x="Transaction Date", y="Mid Point", 
-                         title="Daily Aggregate Trading Volume (Past Year)",
-                         template="plotly_dark",
-                         color_discrete_sequence=['#3b82f6'])
-        fig_time.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+        # Daily volume is aggregated in SQL (GROUP BY transaction_date), so
+        # only ~one row per trading day is shipped to the chart.
+        time_df = load_daily_volume(365, tuple(selected_chambers)).rename(
+            columns={"transaction_date": "Transaction Date", "volume": "Mid Point"}
+        )
+        # Build the figure with graph_objects directly — plotly.express
+        # re-introspects the DataFrame on every rerun, which dominates
+        # chart build time for frames this small.
+        fig_time = go.Figure(go.Scatter(
+            x=time_df["Transaction Date"].to_numpy(),
+            y=time_df["Mid Point"].to_numpy(),
+            mode="lines",
+            fill="tozeroy",
+            line=dict(color='#3b82f6'),
+        ))
+        fig_time.update_layout(
+            title="Daily Aggregate Trading Volume (Past Year)",
+            template="plotly_dark",
+            xaxis_title="Transaction Date",
+            yaxis_title="Mid Point",
+            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        )
         st.plotly_chart(fig_time, width='stretch')
         
     with c2:
         # Sector Pie
-        sector_df = df.groupby("Sector")["Mid Point"].sum().reset_index()
-        fig_sector = px.pie(sector_df, values="Mid Point", names="Sector", 
-                          title="Sector Concentration",
-                          template="plotly_dark",
-                          hole=0.4)
-        fig_sector.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+        sector_df = df.groupby("Sector", observed=True)["Mid Point"].sum().reset_index()
+        fig_sector = go.Figure(go.Pie(
+            labels=sector_df["Sector"].to_numpy(),
+            values=sector_df["Mid Point"].to_numpy(),
+            hole=0.4,
+        ))
+        fig_sector.update_layout(
+            title="Sector Concentration",
+            template="plotly_dark",
+            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        )
         st.plotly_chart(fig_sector, width='stretch')
 
     # Top stocks by volume section – allows you to see which tickers
@@ -472,8 +597,8 @@ if page == "Executive Dashboard":
     buy_df = df[df["Type"] == "BUY"]
     sell_df = df[df["Type"] == "SELL"]
 
-    buy_vol_by_ticker = buy_df.groupby("Ticker")["Mid Point"].sum()
-    sell_vol_by_ticker = sell_df.groupby("Ticker")["Mid Point"].sum()
+    buy_vol_by_ticker = buy_df.groupby("Ticker", observed=True)["Mid Point"].sum()
+    sell_vol_by_ticker = sell_df.groupby("Ticker", observed=True)["Mid Point"].sum()
 
     vol_df = pd.DataFrame({
         "Buy Volume": buy_vol_by_ticker,
@@ -490,15 +615,14 @@ if page == "Executive Dashboard":
         .reset_index(names="Ticker")
     )
 
-    fig_top_stocks = px.bar(
-        top_stocks,
-        x="Ticker",
-        y=sort_col,
+    fig_top_stocks = go.Figure(go.Bar(
+        x=top_stocks["Ticker"].to_numpy(),
+        y=top_stocks[sort_col].to_numpy(),
+        marker_color='#3b82f6',
+    ))
+    fig_top_stocks.update_layout(
         title=f"Top Stocks by {sort_col} (365D)",
         template="plotly_dark",
-        color_discrete_sequence=['#3b82f6'],
-    )
-    fig_top_stocks.update_layout(
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         xaxis_title="Ticker",
@@ -562,7 +686,7 @@ if page == "Executive Dashboard":
         # Flag if trade is positive
         buy_df["Is_Positive"] = buy_df["Estimated ROI (%)"] > 0
         
-        senator_roi = buy_df.groupby("Senator").agg(
+        senator_roi = buy_df.groupby("Senator", observed=True).agg(
             Avg_ROI=("Estimated ROI (%)", "mean"),
             Trades=("Ticker", "count"),
             Positive_Trades=("Is_Positive", "sum")
@@ -646,9 +770,16 @@ if page == "Executive Dashboard":
             )
 
 # --- PAGE 2: LIVE INTELLIGENCE FEED ---
-elif page == "Live Intelligence Feed":
+
+@st.fragment
+def live_feed(df: pd.DataFrame) -> None:
+    """Live Intelligence Feed page, isolated as a fragment.
+
+    Interacting with the party/ticker/unusual widgets reruns only this
+    block instead of the whole script (sidebar, KPIs, charts).
+    """
     st.title("📡 Live Intelligence Feed")
-    
+
     # Advanced Filters
     with st.expander("🔍 Filter Controls", expanded=True):
         f_col1, f_col2, f_col3 = st.columns(3)
@@ -656,7 +787,7 @@ elif page == "Live Intelligence Feed":
             # Use whatever party labels actually exist in the data so that
             # the default selection does not accidentally filter out all rows
             # (e.g. when everything is currently "Unknown").
-            parties = sorted(df["Party"].dropna().unique().tolist())
+            parties = list(_filter_options(df)["parties"])
             party_filter = st.multiselect(
                 "Filter by Party",
                 options=parties,
@@ -666,14 +797,21 @@ elif page == "Live Intelligence Feed":
             ticker_search = st.text_input("Search Ticker", placeholder="e.g. NVDA")
         with f_col3:
             unusual_only = st.checkbox("Show Unusual Trades Only (> $100k Mid-point)")
-            
-    # Apply logic
-    filtered_df = df[df["Party"].isin(party_filter)]
+
+    # Apply logic: build one combined boolean mask and slice once,
+    # instead of materializing an intermediate DataFrame per filter.
+    # Out-of-place & rather than &=: arrays returned by to_numpy() can be
+    # read-only views under copy-on-write, where in-place updates raise.
+    mask = df["Party"].isin(party_filter).to_numpy()
     if ticker_search:
-        filtered_df = filtered_df[filtered_df["Ticker"].str.contains(ticker_search.upper())]
+        # Plain substring scan — regex=False skips pattern compilation and
+        # keeps the per-keystroke rerun on memchr-style C scanning. On the
+        # categorical column this runs once per distinct ticker, not per row.
+        mask = mask & df["Ticker_upper"].str.contains(ticker_search.upper(), regex=False, na=False).to_numpy()
     if unusual_only:
-        filtered_df = filtered_df[filtered_df["Unusual"] == True]
-        
+        mask = mask & df["Unusual"].to_numpy()
+    filtered_df = df[mask]
+
     # Select columns to display
     display_cols = ["Filing Date", "Transaction Date", "Senator", "Ticker", "Type", "Amount Range", "Mid Point", "Unusual"]
     if "Estimated Profit" in df.columns and "Estimated ROI (%)" in df.columns:
@@ -681,10 +819,12 @@ elif page == "Live Intelligence Feed":
 
     # Make sure all columns exist
     display_cols = [c for c in display_cols if c in filtered_df.columns]
-    
-    # Styling the dataframe (Phase 5, Step 21)
+
+    # Styling the dataframe (Phase 5, Step 21). Rows arrive pre-sorted
+    # newest-filing-first from get_trades_data and masking keeps that
+    # order, so no per-rerun sort is needed here.
     st.dataframe(
-        filtered_df[display_cols].sort_values("Filing Date", ascending=False),
+        filtered_df[display_cols],
         column_config={
             "Mid Point": st.column_config.NumberColumn("Estimated Value", format="$%d"),
             "Unusual": st.column_config.CheckboxColumn("🚨"),
@@ -697,26 +837,37 @@ elif page == "Live Intelligence Feed":
         width='stretch',
         hide_index=True
     )
-    
+
     st.download_button(
         label="📥 Export to CSV",
-        data=filtered_df.to_csv().encode('utf-8'),
+        data=_df_to_csv_bytes(filtered_df),
         file_name='congress_trades.csv',
         mime='text/csv',
     )
 
+
 # --- PAGE 3: SENATOR DEEP-DIVES ---
-elif page == "Senator Deep-Dives":
+
+@st.fragment
+def senator_deep_dives(
+    df: pd.DataFrame,
+    vol_year_df: pd.DataFrame,
+    all_trades_df: pd.DataFrame,
+) -> None:
+    """Senator Deep-Dives page, isolated as a fragment.
+
+    Switching legislators reruns only this block, not the full app.
+    """
     st.title("👤 Senator Profiles")
-    
-    selected_senator = st.selectbox("Select a Legislator to Analyze", options=df["Senator"].unique())
-    
+
+    selected_senator = st.selectbox("Select a Legislator to Analyze", options=_filter_options(df)["senators"])
+
     senator_df = df[df["Senator"] == selected_senator]
 
     # Split into buys and sells for clearer volume attribution
     senator_buys = senator_df[senator_df["Type"] == "BUY"]
     senator_sells = senator_df[senator_df["Type"] == "SELL"]
-    
+
     # Profile Header
     p_col1, p_col2 = st.columns([1, 3])
     with p_col1:
@@ -725,46 +876,55 @@ elif page == "Senator Deep-Dives":
         st.header(selected_senator)
         st.markdown(f"**Party:** {senator_df['Party'].iloc[0]}")
         st.markdown(f"**Total Estimated Volume (365D):** ${senator_df['Mid Point'].sum():,.2f}")
-        
+
         if "Estimated Profit" in senator_df.columns:
             sen_profit = senator_df["Estimated Profit"].sum()
             prof_color = "green" if sen_profit >= 0 else "red"
             st.markdown(f"**Total Estimated Profit (365D):** <span style='color:{prof_color}'>${sen_profit:,.2f}</span>", unsafe_allow_html=True)
-            
-        st.markdown(f"**Most Traded Sector:** {senator_df['Sector'].mode()[0] if not senator_df['Sector'].empty else 'Unknown'}")
+
+        # value_counts is a hash-based count (vs mode's sort-based path),
+        # so the single most-common label is just the first index entry.
+        sector_counts = senator_df["Sector"].value_counts(dropna=True)
+        st.markdown(f"**Most Traded Sector:** {sector_counts.index[0] if not sector_counts.empty else 'Unknown'}")
 
     st.markdown("---")
-    
+
     # Senator Charts
     sc1, sc2 = st.columns(2)
     with sc1:
         # Only count BUY trades when attributing "Top Holdings" to avoid
-        # inflating exposure with sells/trim activity.
+        # inflating exposure with sells/trim activity. nlargest does a
+        # partial selection instead of sorting the whole ticker series.
         buy_ticker_vol = (
-            senator_buys.groupby("Ticker")["Mid Point"]
+            senator_buys.groupby("Ticker", observed=True)["Mid Point"]
             .sum()
+            .nlargest(10)
             .sort_values(ascending=True)
-            .tail(10)
         )
-        fig_tickers = px.bar(
-            buy_ticker_vol,
+        fig_tickers = go.Figure(go.Bar(
+            x=buy_ticker_vol.to_numpy(),
+            y=buy_ticker_vol.index.astype(str).to_numpy(),
             orientation='h',
+            marker_color='#10b981',
+        ))
+        fig_tickers.update_layout(
             title="Top Buy Holdings by Volume",
             template="plotly_dark",
-            color_discrete_sequence=['#10b981'],
         )
         st.plotly_chart(fig_tickers, width='stretch')
-        
+
     with sc2:
-        type_counts = senator_df.groupby("Type").size().reset_index(name="count")
-        fig_type = px.pie(
-            type_counts,
-            values="count",
-            names="Type",
+        type_counts = senator_df.groupby("Type", observed=True).size().reset_index(name="count")
+        # Match normalized BUY/SELL labels produced by the scraper.
+        type_colors = {"BUY": "#10b981", "SELL": "#ef4444"}
+        fig_type = go.Figure(go.Pie(
+            labels=type_counts["Type"].astype(str).to_numpy(),
+            values=type_counts["count"].to_numpy(),
+            marker=dict(colors=[type_colors.get(t, "#3b82f6") for t in type_counts["Type"]]),
+        ))
+        fig_type.update_layout(
             title="Buy vs Sell Sentiment",
             template="plotly_dark",
-            # Match normalized BUY/SELL labels produced by the scraper.
-            color_discrete_map={"BUY": "#10b981", "SELL": "#ef4444"},
         )
         st.plotly_chart(fig_type, width='stretch')
 
@@ -964,7 +1124,7 @@ elif page == "Senator Deep-Dives":
         "Owner",
         "Sector",
     ]
-    
+
     if "Estimated Profit" in senator_all_df.columns and "Estimated ROI (%)" in senator_all_df.columns:
         history_cols.extend(["Price At Transaction", "Current Price", "Estimated Profit", "Estimated ROI (%)", "P&L Type"])
 
@@ -988,6 +1148,13 @@ elif page == "Senator Deep-Dives":
         },
     )
 
+
+# --- PAGE DISPATCH (fragment pages) ---
+if page == "Live Intelligence Feed":
+    live_feed(df)
+elif page == "Senator Deep-Dives":
+    senator_deep_dives(df, vol_year_df, all_trades_df)
+
 # --- PAGE 4: MARKET INTELLIGENCE ---
 elif page == "Market Intelligence":
     st.title("🕵️ Market Intelligence")
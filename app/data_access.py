@@ -4,7 +4,8 @@ from datetime import date, timedelta
 
 import time
 import pandas as pd
-from sqlalchemy import text
+import streamlit as st
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import sys
@@ -12,9 +13,26 @@ import os
 # Add the parent directory (project root) to sys.path so we can import 'db'
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from db.config import engine
+from db.config import DATABASE_URL, engine
 
 
+def _connectorx_uri() -> str | None:
+    """Translate DATABASE_URL into a connectorx URI, or None if unsupported.
+
+    connectorx reads query results straight into columnar memory instead
+    of building Python tuples per row, so we prefer it for the dialects
+    it understands. mssql+pyodbc URLs (Azure SQL) deliberately fall
+    through to the SQLAlchemy path, which carries the retry logic.
+    """
+    if DATABASE_URL.startswith("sqlite:///"):
+        # connectorx wants an absolute filesystem path after sqlite://
+        return "sqlite://" + os.path.abspath(DATABASE_URL[len("sqlite:///"):])
+    if DATABASE_URL.startswith(("postgresql://", "mssql://")):
+        return DATABASE_URL
+    return None
+
+
+@st.cache_data(ttl=86_400, persist="disk", show_spinner=False)
 def load_trades_df(
     days: int = 90,
     max_retries: int = 5,
@@ -25,6 +43,11 @@ def load_trades_df(
     This filters on ``filing_date`` so the dashboard reflects recent
     disclosure activity.
 
+    Cached at the data layer with a 24h TTL (matching the refresh cadence
+    of the ingest job) and persisted to disk, so a cold Streamlit worker
+    can skip the DB round trip entirely on warm boots.  Only primitive
+    args are taken so Streamlit's hashing stays cheap.
+
     Uses a DB-agnostic comparison on a concrete cutoff date instead of
     SQLite-specific ``date('now', ...)`` syntax, so it works on both
     SQLite and Azure SQL.
@@ -37,21 +60,56 @@ def load_trades_df(
 
     # Join ticker_metadata so downstream views can use real sector/
     # industry information instead of placeholder values.
-    query = text(
-        """
-        SELECT t.*, m.company_name, m.sector, m.industry
+    #
+    # Select only the columns the dashboard actually consumes instead of
+    # ``t.*`` — the wide String(300) columns (asset_name, comment,
+    # report_id, ...) are never rendered, so pulling them across the wire
+    # just bloats the cached DataFrame.
+    query_str = """
+        SELECT t.transaction_date, t.filing_date,
+               t.senator_display_name, t.chamber,
+               t.transaction_type, t.transaction_type_raw,
+               t.amount_range_raw, t.mid_point, t.unusual,
+               t.ticker, t.owner,
+               t.price_at_transaction, t.current_price,
+               m.sector
         FROM trades AS t
         LEFT JOIN ticker_metadata AS m
           ON t.ticker = m.ticker
         WHERE t.filing_date >= :cutoff
         ORDER BY t.filing_date DESC
         """
-    )
+    query = text(query_str)
+
+    # Fast path: connectorx ingests the result set columnar-first (no
+    # per-row Python tuples), which is several times faster and lighter
+    # than pandas' default read_sql. Optional — any failure (missing
+    # package, unsupported dialect quirk) falls back to SQLAlchemy.
+    cx_uri = _connectorx_uri()
+    if cx_uri is not None:
+        try:
+            import connectorx as cx
+
+            # connectorx takes no bind params; the cutoff is a locally
+            # constructed date, so inlining its ISO form is safe.
+            sql = query_str.replace(":cutoff", f"'{cutoff.isoformat()}'")
+            return cx.read_sql(cx_uri, sql, return_type="pandas")
+        except ImportError:
+            pass
+        except Exception as exc:
+            print(f"[load_trades_df] connectorx read failed, falling back: {exc}")
 
     for attempt in range(1, max_retries + 1):
         try:
             with engine.connect() as conn:
-                return pd.read_sql(query, conn, params={"cutoff": cutoff})
+                return pd.read_sql(
+                    query,
+                    conn,
+                    params={"cutoff": cutoff},
+                    # Materialize dates as datetime64 up front so downstream
+                    # groupbys/sorts don't fall back to object comparisons.
+                    parse_dates=["transaction_date", "filing_date"],
+                )
 
         except OperationalError as exc:
             # Detect the specific timeout pattern conservatively; for
@@ -75,6 +133,116 @@ def load_trades_df(
     return pd.DataFrame()
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def load_kpis(days: int = 365, chambers: tuple[str, ...] | None = None) -> dict:
+    """Compute the Executive Dashboard KPIs as a single SQL aggregation.
+
+    Instead of shipping every trade row to pandas just to reduce it to a
+    handful of sums, we push the reductions into the DB so only scalars
+    cross the wire.  Uses ``CASE WHEN`` rather than ``FILTER`` so the
+    query works on both SQLite and Azure SQL.
+
+    ``chambers`` mirrors the global Chamber sidebar filter: ``None``
+    means "no filter", an empty tuple means "nothing selected" (all
+    KPIs are zero without touching the DB).
+    """
+
+    zero = {
+        "total_volume": 0.0,
+        "buy_volume": 0.0,
+        "sell_volume": 0.0,
+        "unusual_count": 0,
+        "total_trades": 0,
+        "buy_trades": 0,
+        "sell_trades": 0,
+    }
+    if chambers is not None and len(chambers) == 0:
+        return zero
+
+    cutoff = date.today() - timedelta(days=days)
+    chamber_clause = "AND chamber IN :chambers" if chambers else ""
+
+    query = text(
+        f"""
+        SELECT
+            COALESCE(SUM(mid_point), 0) AS total_volume,
+            COALESCE(SUM(CASE WHEN UPPER(transaction_type) = 'BUY'
+                               THEN mid_point END), 0) AS buy_volume,
+            COALESCE(SUM(CASE WHEN UPPER(transaction_type) = 'SELL'
+                               THEN mid_point END), 0) AS sell_volume,
+            COALESCE(SUM(CASE WHEN unusual = 1 THEN 1 ELSE 0 END), 0)
+                AS unusual_count,
+            COUNT(*) AS total_trades,
+            COALESCE(SUM(CASE WHEN UPPER(transaction_type) = 'BUY'
+                               THEN 1 ELSE 0 END), 0) AS buy_trades,
+            COALESCE(SUM(CASE WHEN UPPER(transaction_type) = 'SELL'
+                               THEN 1 ELSE 0 END), 0) AS sell_trades
+        FROM trades
+        WHERE filing_date >= :cutoff
+          AND ticker IS NOT NULL AND ticker NOT IN ('--', '')
+          {chamber_clause}
+        """
+    )
+    if chambers:
+        query = query.bindparams(bindparam("chambers", expanding=True))
+
+    params: dict = {"cutoff": cutoff}
+    if chambers:
+        params["chambers"] = list(chambers)
+
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(query, params).mappings().first()
+            return dict(row) if row is not None else zero
+    except (OperationalError, SQLAlchemyError) as exc:
+        print(f"[load_kpis] DB query failed: {exc}")
+        return zero
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def load_daily_volume(days: int = 365, chambers: tuple[str, ...] | None = None) -> pd.DataFrame:
+    """Daily aggregate trading volume for the dashboard area chart.
+
+    Grouping by ``transaction_date`` in SQL returns ~one row per trading
+    day instead of every trade, so the render path never touches the
+    full row set.  Filter semantics match :func:`load_kpis`.
+    """
+
+    if chambers is not None and len(chambers) == 0:
+        return pd.DataFrame(columns=["transaction_date", "volume"])
+
+    cutoff = date.today() - timedelta(days=days)
+    chamber_clause = "AND chamber IN :chambers" if chambers else ""
+
+    query = text(
+        f"""
+        SELECT transaction_date, SUM(mid_point) AS volume
+        FROM trades
+        WHERE filing_date >= :cutoff
+          AND transaction_date >= :cutoff
+          AND transaction_date IS NOT NULL
+          AND mid_point IS NOT NULL
+          AND ticker IS NOT NULL AND ticker NOT IN ('--', '')
+          {chamber_clause}
+        GROUP BY transaction_date
+        ORDER BY transaction_date ASC
+        """
+    )
+    if chambers:
+        query = query.bindparams(bindparam("chambers", expanding=True))
+
+    params: dict = {"cutoff": cutoff}
+    if chambers:
+        params["chambers"] = list(chambers)
+
+    try:
+        with engine.connect() as conn:
+            return pd.read_sql(query, conn, params=params)
+    except (OperationalError, SQLAlchemyError) as exc:
+        print(f"[load_daily_volume] DB query failed: {exc}")
+        return pd.DataFrame(columns=["transaction_date", "volume"])
+
+
 def load_all_trades_df() -> pd.DataFrame:
     """Load every trade in the DB with no date filter, joining ticker_metadata.
 
@@ -97,7 +265,11 @@ def load_all_trades_df() -> pd.DataFrame:
 
     try:
         with engine.connect() as conn:
-            return pd.read_sql(query, conn)
+            return pd.read_sql(
+                query,
+                conn,
+                parse_dates=["transaction_date", "filing_date"],
+            )
     except (OperationalError, SQLAlchemyError) as exc:
         print(f"[load_all_trades_df] DB query failed: {exc}")
         return pd.DataFrame()
@@ -125,7 +297,7 @@ def load_volume_by_year_df() -> pd.DataFrame:
 
     try:
         with engine.connect() as conn:
-            return pd.read_sql(query, conn)
+            return pd.read_sql(query, conn, parse_dates=["transaction_date"])
     except (OperationalError, SQLAlchemyError) as exc:
         print(f"[load_volume_by_year_df] DB query failed: {exc}")
         return pd.DataFrame()
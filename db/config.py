@@ -23,7 +23,20 @@ if DATABASE_URL.startswith("sqlite"):
     # check_same_thread=False: required when the engine is shared across threads.
     _sqlite_args = {"timeout": 60, "check_same_thread": False}
 
-engine = create_engine(DATABASE_URL, echo=False, future=True, connect_args=_sqlite_args)
+# pool_pre_ping replaces connections Azure SQL silently dropped while
+# idle (otherwise the first query after a drop eats the full login
+# timeout); pool_recycle retires connections before the server's idle
+# cutoff. Both are cheap no-ops for local SQLite.
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    connect_args=_sqlite_args,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_size=5,
+    max_overflow=5,
+)
 
 
 @sqlalchemy.event.listens_for(engine, "connect")
@@ -45,6 +58,58 @@ def init_db() -> None:
 
     Base.metadata.create_all(bind=engine)
 
+    # Add the ingest-time `unusual` column to trades created before it
+    # existed, then backfill it. Both steps are idempotent and must run
+    # before index creation below (the column is indexed).
+    insp = sqlalchemy.inspect(engine)
+    trade_cols = {c["name"] for c in insp.get_columns("trades")}
+    with engine.connect() as conn:
+        if "unusual" not in trade_cols:
+            # SQL Server takes neither COLUMN nor BOOLEAN in ADD DDL.
+            if engine.dialect.name == "mssql":
+                conn.execute(text("ALTER TABLE trades ADD unusual BIT"))
+            else:
+                conn.execute(text("ALTER TABLE trades ADD COLUMN unusual BOOLEAN"))
+        conn.execute(text(
+            "UPDATE trades SET unusual = "
+            "CASE WHEN mid_point > 100000 THEN 1 ELSE 0 END "
+            "WHERE unusual IS NULL"
+        ))
+        conn.commit()
+
+    # create_all only builds indexes for brand-new tables, so explicitly
+    # create any indexes added to models after a table already existed
+    # (e.g. the composite price_cache index). checkfirst makes this a
+    # no-op on DBs that already have them.
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # Conversely, drop indexes the models no longer declare: the
+    # per-column price_cache indexes (the unique constraint's composite
+    # already covers the ticker+date lookup) and the ascending
+    # filing-date index superseded by ix_trades_filing_date_desc.
+    # create_all/index.create never remove anything from older DBs, and
+    # every extra index is maintenance overhead on the hot write paths.
+    stale_indexes = {
+        "price_cache": (
+            "ix_price_cache_ticker",
+            "ix_price_cache_date",
+            "ix_price_cache_ticker_date",
+        ),
+        "trades": ("ix_trades_filing_date",),
+    }
+    with engine.connect() as conn:
+        for table_name, names in stale_indexes.items():
+            existing = {ix["name"] for ix in insp.get_indexes(table_name)}
+            for name in names:
+                if name in existing:
+                    if engine.dialect.name == "mssql":
+                        conn.execute(text(f"DROP INDEX {name} ON {table_name}"))
+                    else:
+                        conn.execute(text(f"DROP INDEX {name}"))
+        conn.commit()
+
     # Normalise any remaining "Last, First (Senator)" display names to "First Last".
     # Safe to re-run: rows already in canonical form are not matched by the LIKE filter.
     def _normalise(role: str) -> str:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Date, Float, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, Date, Float, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 
 
@@ -33,7 +33,9 @@ class Trade(Base):
     report_id = Column(String(100), index=True)
     report_type = Column(String(50))
     report_format = Column(String(20))
-    filing_date = Column(Date, index=True)
+    # Indexed descending below (ix_trades_filing_date_desc) to match the
+    # dashboard's WHERE filing_date >= :cutoff ORDER BY filing_date DESC.
+    filing_date = Column(Date)
 
     transaction_date = Column(Date, index=True)
     owner = Column(String(50))
@@ -49,6 +51,11 @@ class Trade(Base):
     amount_max = Column(Float)
     mid_point = Column(Float)
 
+    # Derived at ingest time (mid_point > $100k) so the dashboard's
+    # "unusual trades" KPI is a single indexed scan instead of a
+    # per-render pandas derivation.
+    unusual = Column(Boolean, default=False, index=True)
+
     comment = Column(String(500))
 
     # Enriched pricing fields
@@ -73,6 +80,12 @@ class Trade(Base):
     )
 
 
+# The dashboard's hot query filters and sorts on filing_date DESC; a
+# descending index lets dialects without backward index scans (e.g. SQL
+# Server) satisfy it without a sort step.
+Index("ix_trades_filing_date_desc", Trade.filing_date.desc())
+
+
 class TickerMetadata(Base):
     """Metadata for traded tickers (company, sector, industry).
 
@@ -124,11 +137,15 @@ class PriceCache(Base):
     __tablename__ = "price_cache"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    ticker = Column(String(32), index=True)
-    date = Column(Date, index=True)
+    ticker = Column(String(32))
+    date = Column(Date)
     price = Column(Float)
     last_updated = Column(Date)
 
+    # The hot lookup filters on ticker AND date (ORDER BY date DESC
+    # LIMIT 1); the unique constraint's own (ticker, date) index serves
+    # it with one range scan, so no extra index is declared. The old
+    # standalone per-column indexes are dropped by the init_db migration.
     __table_args__ = (
         UniqueConstraint("ticker", "date", name="uq_price_cache_ticker_date"),
     )
@@ -13,16 +13,52 @@ Phase B responsibilities (from the high-level plan):
 from __future__ import annotations
 
 import datetime as dt
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import pandas as pd
 import yfinance as yf
-from sqlalchemy import and_, select
+from sqlalchemy import insert, literal, select, union_all
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .config import SessionLocal
 from .models import PriceCache
 
 
+def _bulk_insert_price_rows(session: Session, ticker: str, rows: list) -> None:
+    """Bulk-insert cache rows for one ticker, skipping dates already cached.
+
+    On SQLite this is a single ``INSERT ... ON CONFLICT DO NOTHING``
+    against ``uq_price_cache_ticker_date``; other dialects (e.g. Azure
+    SQL) pre-filter existing dates with one SELECT and then issue one
+    bulk INSERT.
+    """
+
+    if not rows:
+        return
+
+    if session.get_bind().dialect.name == "sqlite":
+        stmt = (
+            sqlite_insert(PriceCache)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["ticker", "date"])
+        )
+        session.execute(stmt)
+        return
+
+    existing = set(
+        session.execute(
+            select(PriceCache.date).where(
+                PriceCache.ticker == ticker,
+                PriceCache.date.in_([r["date"] for r in rows]),
+            )
+        ).scalars()
+    )
+    new_rows = [r for r in rows if r["date"] not in existing]
+    if new_rows:
+        session.execute(insert(PriceCache), new_rows)
+
+
 def get_price_on_or_before(
     session: Session,
     ticker: str,
@@ -73,97 +109,192 @@ def get_price_on_or_before(
     if hist.empty:
         return None
 
-    # Insert all returned daily prices into the cache.
-    for idx, row in hist.iterrows():
-        day = idx.date()
-        close_val = row["Close"]
-        # If this is a 1-element Series, use iloc[0]; otherwise just cast
-        if hasattr(close_val, "iloc"):
-            price = float(close_val.iloc[0])
-        else:
-            price = float(close_val)
+    # Insert all returned daily prices into the cache with one bulk
+    # statement instead of a per-row SELECT + session.add. ravel()
+    # handles both the flat and single-column-MultiIndex shapes that
+    # yf.download can return for a single ticker.
+    rows = [
+        {"ticker": ticker, "date": day, "price": float(price), "last_updated": target_date}
+        for day, price in zip(hist.index.date, hist["Close"].to_numpy(dtype=float).ravel())
+    ]
+    _bulk_insert_price_rows(session, ticker, rows)
+    session.flush()
 
-        existing = session.execute(
-            select(PriceCache).where(
-                and_(PriceCache.ticker == ticker, PriceCache.date == day)
+    # 3. The answer is already in ``rows`` — pick the closest prior close
+    # locally instead of re-running the cache query. Only fall back to the
+    # DB when the downloaded window holds nothing on or before the target
+    # (e.g. a cached close outside the 30-day fetch window).
+    on_or_before = [r for r in rows if r["date"] <= target_date]
+    if on_or_before:
+        return max(on_or_before, key=lambda r: r["date"])["price"]
+
+    cached = session.execute(stmt).scalars().first()
+    return cached.price if cached is not None else None
+
+
+def _lookup_prices_on_or_before(
+    session: Session,
+    pairs: List[Tuple[str, dt.date]],
+) -> Dict[tuple, Tuple[Optional[float], Optional[dt.date]]]:
+    """Resolve "closest prior close" for many pairs with set-based SQL.
+
+    For each ``(ticker, tx_date)`` pair the DB picks the row itself via
+    correlated scalar subqueries against the ``(ticker, date)`` index, so
+    only one result row per pair is shipped back instead of every cached
+    close for the involved tickers. Pairs are batched into UNION ALL
+    statements (SQLite has no LATERAL join; correlated subqueries compile
+    on both SQLite and SQL Server).
+
+    Returns ``{(ticker, tx_date): (price, date_of_price)}``; pairs with
+    no cached close on or before their date map to ``(None, None)``.
+    """
+
+    results: Dict[tuple, Tuple[Optional[float], Optional[dt.date]]] = {}
+    chunk = 100  # pairs per statement; keeps parameter counts modest
+    for i in range(0, len(pairs), chunk):
+        selects = []
+        for ticker, tx_date in pairs[i:i + chunk]:
+            base = (
+                select(PriceCache.price)
+                .where(PriceCache.ticker == ticker, PriceCache.date <= tx_date)
+                .order_by(PriceCache.date.desc())
+                .limit(1)
             )
-        ).scalars().first()
-
-        if existing is None:
-            session.add(
-                PriceCache(
-                    ticker=ticker,
-                    date=day,
-                    price=price,
-                    last_updated=target_date,
+            selects.append(
+                select(
+                    literal(ticker),
+                    literal(tx_date),
+                    base.scalar_subquery(),
+                    base.with_only_columns(PriceCache.date).scalar_subquery(),
                 )
             )
+        for ticker, tx_date, price, hit_date in session.execute(union_all(*selects)):
+            results[(ticker, tx_date)] = (
+                float(price) if price is not None else None,
+                hit_date,
+            )
+    return results
 
-    session.flush()
 
-    # 3. Re-query cache for the desired date (or closest prior).
-    cached = session.execute(stmt).scalars().first()
-    return cached.price if cached is not None else None
+def _close_series(hist: pd.DataFrame, ticker: str) -> Optional[pd.Series]:
+    """Extract one ticker's Close series from a (possibly batched) download.
 
+    ``yf.download`` returns flat columns for a single ticker and a
+    ``(ticker, field)`` MultiIndex with ``group_by='ticker'`` for many.
+    """
 
-def get_latest_price(session: Session, ticker: str) -> Optional[float]:
-    """Return the most recent available close for ``ticker``.
+    if isinstance(hist.columns, pd.MultiIndex):
+        if ticker not in hist.columns.get_level_values(0):
+            return None
+        sub = hist[ticker]
+        return sub["Close"].dropna() if "Close" in sub.columns else None
+    return hist["Close"].dropna() if "Close" in hist.columns else None
 
-    We download recent history from yfinance (~30 days) and update the
-    cache with the last available close.
+
+def _upsert_price_rows(session: Session, rows: list) -> None:
+    """Insert-or-update cache rows in bulk (price refreshes allowed).
+
+    Unlike :func:`_bulk_insert_price_rows`, an existing (ticker, date)
+    row gets its price and last_updated overwritten — used for
+    latest-close refreshes.
     """
 
+    if not rows:
+        return
+
+    if session.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(PriceCache).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["ticker", "date"],
+            set_={"price": stmt.excluded.price, "last_updated": stmt.excluded.last_updated},
+        )
+        session.execute(stmt)
+        return
+
+    tickers = {r["ticker"] for r in rows}
+    dates = {r["date"] for r in rows}
+    existing = {
+        (obj.ticker, obj.date): obj
+        for obj in session.execute(
+            select(PriceCache).where(
+                PriceCache.ticker.in_(tickers), PriceCache.date.in_(dates)
+            )
+        ).scalars()
+    }
+    new_rows = []
+    for r in rows:
+        obj = existing.get((r["ticker"], r["date"]))
+        if obj is None:
+            new_rows.append(r)
+        else:
+            obj.price = r["price"]
+            obj.last_updated = r["last_updated"]
+    if new_rows:
+        session.execute(insert(PriceCache), new_rows)
+
+
+def get_latest_prices(session: Session, tickers: Iterable[str]) -> Dict[str, float]:
+    """Return the most recent available close for each of ``tickers``.
+
+    All tickers are fetched with a single batched ``yf.download`` call
+    (Yahoo is hit concurrently via its internal thread pool) instead of
+    one HTTP round trip per ticker, and the cache is refreshed with one
+    bulk upsert. Tickers that yield no data are simply absent from the
+    returned mapping.
+    """
+
+    tickers = sorted({t for t in tickers if t})
+    if not tickers:
+        return {}
+
     today = dt.date.today()
     start = today - dt.timedelta(days=30)
 
     try:
         hist = yf.download(
-            ticker,
+            tickers=tickers,
             start=start,
             end=today + dt.timedelta(days=1),
             progress=False,
+            threads=True,
+            group_by="ticker",
         )
     except Exception as exc:  # pragma: no cover - defensive
-        print(f"[prices] yfinance latest price download failed for {ticker}: {exc}")
-        return None
+        print(f"[prices] yfinance latest price download failed: {exc}")
+        return {}
+
+    if hist is None or hist.empty:
+        return {}
+
+    latest: Dict[str, float] = {}
+    rows = []
+    for ticker in tickers:
+        closes = _close_series(hist, ticker)
+        if closes is None or closes.empty:
+            continue
+        last_price = float(closes.iloc[-1])
+        latest[ticker] = last_price
+        rows.append({
+            "ticker": ticker,
+            "date": closes.index[-1].date(),
+            "price": last_price,
+            "last_updated": today,
+        })
+
+    _upsert_price_rows(session, rows)
+    session.flush()
+    return latest
 
-    if hist.empty:
-        return None
 
-    last_idx = hist.index[-1]
-    last_date = last_idx.date()
-    # Access the last close value via the Close series so we get a
-    # scalar instead of a single-element Series, avoiding pandas'
-    # FutureWarning about float(Series).
-    last_close = hist["Close"].iloc[-1]
-    # If last_close is a Series (e.g. from a MultiIndex/DataFrame), take
-    # the first element explicitly; otherwise just cast.
-    if hasattr(last_close, "iloc"):
-        last_price = float(last_close.iloc[0])
-    else:
-        last_price = float(last_close)
-
-    existing = session.execute(
-        select(PriceCache).where(
-            and_(PriceCache.ticker == ticker, PriceCache.date == last_date)
-        )
-    ).scalars().first()
-
-    if existing is None:
-        session.add(
-            PriceCache(
-                ticker=ticker,
-                date=last_date,
-                price=last_price,
-                last_updated=today,
-            )
-        )
-        session.flush()
-    else:
-        existing.price = last_price
-        existing.last_updated = today
+def get_latest_price(session: Session, ticker: str) -> Optional[float]:
+    """Return the most recent available close for ``ticker``.
 
-    return last_price
+    Single-ticker convenience wrapper around :func:`get_latest_prices`
+    (kept for notebooks and ad-hoc callers; batch callers should use the
+    plural form directly).
+    """
+
+    return get_latest_prices(session, [ticker]).get(ticker)
 
 
 def update_all_current_prices() -> None:
@@ -180,14 +311,10 @@ def update_all_current_prices() -> None:
         # Get all unique tickers in the database that are not null
         stmt = select(Trade.ticker).where(Trade.ticker.isnot(None)).distinct()
         tickers = [row[0] for row in session.execute(stmt).fetchall()]
-        
-        # Fetch the latest price for each ticker and map it
-        latest_prices: Dict[str, float] = {}
-        for ticker in tickers:
-            price = get_latest_price(session, ticker)
-            if price is not None:
-                latest_prices[ticker] = price
-                
+
+        # Fetch the latest prices for all tickers in one batched call
+        latest_prices: Dict[str, float] = get_latest_prices(session, tickers)
+
         # Update all trades with the new latest prices
         # We process in batches or just load all trades, but for simplicity
         # we can just query all trades that have a ticker and update them.
@@ -232,42 +359,105 @@ def enrich_prices_for_trades(df) -> Tuple[Set[str], Set[tuple]]:
         return failed_tickers, failed_pairs
 
     with SessionLocal() as session:
-        # Map (ticker, transaction_date) -> price_at_transaction
+        # Map (ticker, transaction_date) -> price_at_transaction.
+        #
+        # All pairs are resolved with a handful of set-based SQL lookups
+        # (the DB picks the closest prior close per pair via its index);
+        # only genuine cache misses trigger a single batched yfinance
+        # download and bulk INSERTs, instead of per-pair SELECT/add
+        # round trips.
         df_nonnull = df.dropna(subset=["ticker", "transaction_date"]).copy()
-        distinct_pairs = (
-            df_nonnull[["ticker", "transaction_date"]]
+        distinct_pairs = [
+            (ticker, tx_date)
+            for ticker, tx_date in df_nonnull[["ticker", "transaction_date"]]
             .drop_duplicates()
             .itertuples(index=False, name=None)
-        )
+            if ticker
+        ]
+
+        lookups = _lookup_prices_on_or_before(session, distinct_pairs)
 
         price_at_tx: Dict[tuple, float] = {}
+        stale_prices: Dict[tuple, float] = {}
+        misses: List[tuple] = []
         for ticker, tx_date in distinct_pairs:
-            if not ticker:
-                continue
-            price = get_price_on_or_before(session, ticker, tx_date)
-            if price is not None:
+            price, hit_date = lookups.get((ticker, tx_date), (None, None))
+            # Same freshness rule as get_price_on_or_before: a cached
+            # close more than ~4 days old may just mean we never fetched
+            # the gap, so treat it as a miss (but keep it as a fallback).
+            if price is not None and (tx_date - hit_date).days < 4:
                 price_at_tx[(ticker, tx_date)] = price
             else:
-                # Track failed (ticker, date) pairs so callers can
-                # inspect / log them. Other tickers and dates are
-                # unaffected.
-                failed_pairs.add((ticker, tx_date))
+                if price is not None:
+                    stale_prices[(ticker, tx_date)] = price
+                misses.append((ticker, tx_date))
+
+        if misses:
+            miss_tickers = sorted({t for t, _ in misses})
+            start = min(d for _, d in misses) - dt.timedelta(days=30)
+            end = max(d for _, d in misses) + dt.timedelta(days=1)
+
+            hist = None
+            try:
+                hist = yf.download(
+                    tickers=miss_tickers,
+                    start=start,
+                    end=end,
+                    progress=False,
+                    threads=True,
+                    group_by="ticker",
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                print(f"[prices] batched yfinance download failed: {exc}")
+
+            if hist is not None and not hist.empty:
+                today = dt.date.today()
+                inserted_any = False
+                for ticker in miss_tickers:
+                    closes = _close_series(hist, ticker)
+                    if closes is None or closes.empty:
+                        continue
+                    # _bulk_insert_price_rows skips already-cached dates,
+                    # so no pre-dedup against the cache is needed here.
+                    _bulk_insert_price_rows(session, ticker, [
+                        {
+                            "ticker": ticker,
+                            "date": idx.date(),
+                            "price": float(close_val),
+                            "last_updated": today,
+                        }
+                        for idx, close_val in closes.items()
+                    ])
+                    inserted_any = True
+
+                if inserted_any:
+                    session.flush()
+                    lookups = _lookup_prices_on_or_before(session, misses)
+
+            for ticker, tx_date in misses:
+                price, _ = lookups.get((ticker, tx_date), (None, None))
+                if price is None:
+                    # Fall back to the stale cached close (mirrors the
+                    # old re-query behaviour when the fetch adds nothing).
+                    price = stale_prices.get((ticker, tx_date))
+                if price is not None:
+                    price_at_tx[(ticker, tx_date)] = price
+                else:
+                    # Track failed (ticker, date) pairs so callers can
+                    # inspect / log them. Other tickers and dates are
+                    # unaffected.
+                    failed_pairs.add((ticker, tx_date))
 
         df["price_at_transaction"] = [
             price_at_tx.get((t, d)) if (t is not None and d is not None) else None
             for t, d in zip(df.get("ticker"), df.get("transaction_date"))
         ]
 
-        # Map ticker -> latest price
+        # Map ticker -> latest price via one batched download.
         tickers = sorted({t for t in df.get("ticker").dropna().unique() if t})
-        latest_prices: Dict[str, float] = {}
-        for ticker in tickers:
-            price = get_latest_price(session, ticker)
-            if price is not None:
-                latest_prices[ticker] = price
-            else:
-                # Record tickers whose latest-price lookup failed.
-                failed_tickers.add(ticker)
+        latest_prices: Dict[str, float] = get_latest_prices(session, tickers)
+        # Record tickers whose latest-price lookup failed.
+        failed_tickers.update(t for t in tickers if t not in latest_prices)
 
         df["current_price"] = [
             latest_prices.get(t) if t is not None else None
@@ -6,15 +6,25 @@ populates the ``ticker_metadata`` table using yfinance.
 
 from __future__ import annotations
 
+import time
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import yfinance as yf
-from sqlalchemy import distinct, select
+from sqlalchemy import exists, insert, select
 from sqlalchemy.orm import Session
 
 from .config import SessionLocal
 from .models import TickerMetadata, Trade
+from .yf_cache import FileCache
+
+# Symbols per yf.Tickers batch. One shared session (and one auth/crumb
+# handshake) serves the whole chunk instead of one per ticker.
+_INFO_CHUNK = 20
+
+# On-disk TTL cache so repeated enrichment runs skip the network for
+# tickers already seen (90d positive / 24h negative TTLs).
+_info_cache = FileCache()
 
 
 
@@ -23,49 +33,39 @@ def _find_unknown_tickers(session: Session, limit: Optional[int] = None) -> List
 
     A ticker is considered "unknown" if there is no corresponding row in
     ``ticker_metadata``. Null / empty tickers are skipped.
+
+    NOT EXISTS probes the ticker_metadata primary key per distinct ticker
+    instead of the outer-join + anti-filter pattern, and the limit lives
+    in the SQL so the database can stop early rather than streaming the
+    whole distinct set to Python.
     """
 
     stmt = (
-        select(distinct(Trade.ticker))
-        .outerjoin(TickerMetadata, Trade.ticker == TickerMetadata.ticker)
+        select(Trade.ticker)
         .where(
             Trade.ticker.is_not(None),
             Trade.ticker != "",
-            TickerMetadata.ticker.is_(None),
+            ~exists().where(TickerMetadata.ticker == Trade.ticker),
         )
+        .distinct()
     )
-
-    rows = session.execute(stmt).scalars().all()
-    tickers = [t for t in rows if t]
-
     if limit is not None:
-        return tickers[:limit]
-    return tickers
-
+        stmt = stmt.limit(limit)
 
-def _fetch_ticker_info_yf(ticker: str) -> dict | None:
-    """Fetch basic ticker metadata from yfinance.
+    return session.execute(stmt).scalars().all()
 
-    Returns a dict with keys: company_name, sector, industry. If the
-    lookup fails or yfinance has no useful data, returns None.
-    """
 
-    try:
-        t = yf.Ticker(ticker)
-        info = t.info or {}
-    except Exception as exc:  # pragma: no cover - defensive
-        print(f"[ticker_metadata] yfinance lookup failed for {ticker}: {exc}")
-        return None
+def _meta_from_info(info: dict) -> dict | None:
+    """Extract the metadata fields we persist from a yfinance info dict.
 
-    if not info:
-        return None
+    Returns None when there is nothing useful, so we can try again later
+    (or handle those tickers manually).
+    """
 
     company_name = info.get("longName") or info.get("shortName")
     sector = info.get("sector")
     industry = info.get("industry")
 
-    # If we have absolutely nothing useful, skip creating a row so we
-    # can try again later (or handle these tickers manually).
     if not any([company_name, sector, industry]):
         return None
 
@@ -76,26 +76,107 @@ def _fetch_ticker_info_yf(ticker: str) -> dict | None:
     }
 
 
-def _upsert_ticker_metadata(session: Session, ticker: str, meta: dict) -> None:
-    """Insert or update a TickerMetadata row for ``ticker``."""
+def _fetch_ticker_infos_yf(tickers: List[str]) -> Dict[str, dict]:
+    """Fetch basic metadata for many tickers from yfinance, in batches.
+
+    ``yf.Ticker(t).info`` in a loop pays the full auth/crumb handshake
+    per symbol — the heaviest, most rate-limited yfinance call. Grouping
+    symbols through ``yf.Tickers`` shares one session (and handshake) per
+    chunk of ``_INFO_CHUNK``, with a short sleep between chunks to stay
+    friendly to Yahoo's rate limits. (Yahoo's batch /v7/finance/quote
+    endpoint now requires crumb auth itself, so the shared-session route
+    is the practical batching mechanism.)
+
+    Results are layered over the on-disk TTL cache: tickers with a fresh
+    cache entry (positive or negative) never reach the network, and every
+    network outcome — including "nothing useful" — is written back so the
+    next run can skip it.
+
+    Returns ``{ticker: meta}``; tickers with no useful data are absent.
+    """
+
+    results: Dict[str, dict] = {}
+
+    to_fetch: List[str] = []
+    for ticker in tickers:
+        hit, cached = _info_cache.lookup(ticker)
+        if hit:
+            if cached is not None:
+                results[ticker] = cached
+            # A fresh negative entry means "known to have nothing" — skip.
+        else:
+            to_fetch.append(ticker)
+
+    for i in range(0, len(to_fetch), _INFO_CHUNK):
+        chunk = to_fetch[i:i + _INFO_CHUNK]
+        if i:
+            time.sleep(1.0)
+
+        try:
+            batch = yf.Tickers(" ".join(chunk))
+        except Exception as exc:  # pragma: no cover - defensive
+            print(f"[ticker_metadata] yfinance batch init failed: {exc}")
+            continue
+
+        for ticker in chunk:
+            t = batch.tickers.get(ticker.upper()) or batch.tickers.get(ticker)
+            if t is None:
+                continue
+            try:
+                info = t.info or {}
+            except Exception as exc:  # pragma: no cover - defensive
+                print(f"[ticker_metadata] yfinance lookup failed for {ticker}: {exc}")
+                if "429" in str(exc):
+                    # Rate limited — back off before the next symbol.
+                    time.sleep(5.0)
+                continue
+
+            meta = _meta_from_info(info)
+            _info_cache.store(ticker, meta)
+            if meta is not None:
+                results[ticker] = meta
+
+    return results
+
+
+def _upsert_ticker_metadata(session: Session, metas: Dict[str, dict]) -> None:
+    """Insert or update TickerMetadata rows for all of ``metas`` at once.
+
+    One SELECT fetches every existing row instead of a session.get per
+    ticker; updates go through the loaded ORM objects and all inserts
+    land in a single bulk INSERT.
+    """
+
+    if not metas:
+        return
 
-    obj = session.get(TickerMetadata, ticker)
     today = date.today()
+    existing = {
+        obj.ticker: obj
+        for obj in session.execute(
+            select(TickerMetadata).where(TickerMetadata.ticker.in_(metas))
+        ).scalars()
+    }
 
-    if obj is None:
-        obj = TickerMetadata(
-            ticker=ticker,
-            company_name=meta.get("company_name"),
-            sector=meta.get("sector"),
-            industry=meta.get("industry"),
-            last_updated=today,
-        )
-        session.add(obj)
-    else:
-        obj.company_name = meta.get("company_name", obj.company_name)
-        obj.sector = meta.get("sector", obj.sector)
-        obj.industry = meta.get("industry", obj.industry)
-        obj.last_updated = today
+    new_rows = []
+    for ticker, meta in metas.items():
+        obj = existing.get(ticker)
+        if obj is None:
+            new_rows.append({
+                "ticker": ticker,
+                "company_name": meta.get("company_name"),
+                "sector": meta.get("sector"),
+                "industry": meta.get("industry"),
+                "last_updated": today,
+            })
+        else:
+            obj.company_name = meta.get("company_name", obj.company_name)
+            obj.sector = meta.get("sector", obj.sector)
+            obj.industry = meta.get("industry", obj.industry)
+            obj.last_updated = today
+
+    if new_rows:
+        session.execute(insert(TickerMetadata), new_rows)
 
 
 def enrich_ticker_metadata(max_tickers: int = 50) -> int:
@@ -114,13 +195,9 @@ def enrich_ticker_metadata(max_tickers: int = 50) -> int:
         if not tickers:
             return 0
 
-        for ticker in tickers:
-            meta = _fetch_ticker_info_yf(ticker)
-            if meta is None:
-                continue
-
-            _upsert_ticker_metadata(session, ticker, meta)
-            updated += 1
+        metas = _fetch_ticker_infos_yf(tickers)
+        _upsert_ticker_metadata(session, metas)
+        updated = len(metas)
 
         session.commit()
 
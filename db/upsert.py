@@ -2,73 +2,157 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import pandas as pd
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .config import SessionLocal
 from .models import Trade
 
+# Rows per INSERT statement. Kept well under SQLite's historical
+# 999-bound-parameter limit even with ~20 columns per row thanks to
+# SQLAlchemy's insertmanyvalues batching, and small enough not to bloat
+# a single statement on Azure SQL either.
+_INSERT_CHUNK = 500
 
-def upsert_trades(trades: Iterable[Dict[str, Any]]) -> int:
+_IDENTITY_COLS = ("senator_name", "ticker", "transaction_date", "amount_min", "amount_max")
+
+
+def _identity_key(t: Dict[str, Any]) -> Tuple[Any, Any, Any, Any, Any]:
+    """Identity tuple matching the ``uq_trade_identity`` constraint."""
+
+    return tuple(t.get(c) for c in _IDENTITY_COLS)
+
+
+def _iter_frame_rows(df: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    """Yield row dicts from a trades DataFrame, restricted to Trade columns.
+
+    ``itertuples`` + zip is markedly cheaper than ``to_dict('records')``
+    for wide frames, and yielding lets the caller avoid holding a second
+    full materialization of the data.
+    """
+
+    cols = [c for c in df.columns if c in Trade.__table__.columns.keys()]
+    sub = df[cols]
+    for values in sub.itertuples(index=False, name=None):
+        yield dict(zip(cols, values))
+
+
+def upsert_trades(trades: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> int:
     """Insert new trades, skipping ones that already exist.
 
-    Uses a lookup-before-insert strategy based on the same fields as the
-    ``uq_trade_identity`` constraint on ``Trade`` and also deduplicates
-    within the current batch to avoid violating the UNIQUE constraint when
-    multiple identical trades appear in a single scrape.
+    Accepts either an iterable of trade dicts or a trades DataFrame
+    directly — ingest callers no longer need a ``to_dict('records')``
+    round trip just to feed this function.
+
+    On SQLite, dedup is pushed into the database itself: chunked
+    ``INSERT ... ON CONFLICT DO NOTHING`` statements against
+    ``uq_trade_identity``, so existing rows cost one index probe instead
+    of a prior SELECT (and there is no check-then-insert race). Other
+    dialects (e.g. Azure SQL, which has no ON CONFLICT) pre-fetch the
+    existing identity keys with one scoped SELECT and bulk-insert the
+    remainder.
+
+    Also deduplicates within the current batch to avoid inserting the
+    same trade twice when it appears multiple times in a single scrape.
 
     Returns the number of newly inserted rows.
     """
 
-    inserted = 0
-    # Track keys we've already processed in this batch to avoid inserting
-    # duplicate rows within a single run (in-memory duplicates).
-    seen_keys: set[tuple[Any, Any, Any, Any, Any]] = set()
+    if isinstance(trades, pd.DataFrame):
+        trades = _iter_frame_rows(trades)
 
-    with SessionLocal() as session:
-        for t in trades:
-            key = (
-                t.get("senator_name"),
-                t.get("ticker"),
-                t.get("transaction_date"),
-                t.get("amount_min"),
-                t.get("amount_max"),
-            )
-
-            # Skip duplicates within this batch
-            if key in seen_keys:
-                continue
-            seen_keys.add(key)
-
-            # Skip if already present in the database
-            if _trade_exists(session, t):
-                continue
-
-            session.add(_trade_from_dict(t))
-            inserted += 1
+    seen_keys: set[tuple] = set()
+    rows: List[Dict[str, Any]] = []
+    for t in trades:
+        key = _identity_key(t)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        rows.append(_row_from_dict(t))
+
+    if not rows:
+        return 0
 
+    with SessionLocal() as session:
+        if session.get_bind().dialect.name == "sqlite":
+            # SQLite UNIQUE constraints treat NULLs as distinct, so rows
+            # with a NULL identity field would sail past ON CONFLICT and
+            # re-insert on every run; those few go through the SELECT
+            # filter like on other dialects.
+            conflict_rows = [r for r in rows if None not in _identity_key(r)]
+            null_rows = [r for r in rows if None in _identity_key(r)]
+
+            inserted = 0
+            for i in range(0, len(conflict_rows), _INSERT_CHUNK):
+                stmt = (
+                    sqlite_insert(Trade)
+                    .values(conflict_rows[i:i + _INSERT_CHUNK])
+                    .on_conflict_do_nothing(index_elements=list(_IDENTITY_COLS))
+                )
+                inserted += session.execute(stmt).rowcount
+            inserted += _insert_missing(session, null_rows)
+            session.commit()
+            return inserted
+
+        inserted = _insert_missing(session, rows)
         session.commit()
+        return inserted
+
 
-    return inserted
+def _insert_missing(session, rows: List[Dict[str, Any]]) -> int:
+    """SELECT-filter ``rows`` against existing identity keys, insert the rest."""
 
+    if not rows:
+        return 0
+    existing = _existing_identity_keys(session, rows)
+    new_rows = [r for r in rows if _identity_key(r) not in existing]
+    if new_rows:
+        # One executemany call; SQLAlchemy's insertmanyvalues splits it
+        # into dialect-appropriate batches, so no manual chunking here
+        # (unlike the ON CONFLICT .values() path, whose parameters we
+        # size ourselves).
+        session.execute(insert(Trade), new_rows)
+    return len(new_rows)
 
-def _trade_exists(session: Session, t: Dict[str, Any]) -> bool:
-    """Check whether a trade already exists based on identity fields."""
 
-    stmt = select(Trade).where(
-        Trade.senator_name == t.get("senator_name"),
-        Trade.ticker == t.get("ticker"),
-        Trade.transaction_date == t.get("transaction_date"),
-        Trade.amount_min == t.get("amount_min"),
-        Trade.amount_max == t.get("amount_max"),
-    )
-    return session.execute(stmt).first() is not None
+def _existing_identity_keys(session, rows: List[Dict[str, Any]]) -> set[tuple]:
+    """Fetch identity keys already in the DB for this batch.
 
+    One SELECT of the ``uq_trade_identity`` columns scoped to the
+    batch's transaction dates (date scoping instead of tuple-IN keeps
+    the query portable and NULL-safe — the final key match happens on
+    Python tuples), plus a separate fetch for NULL-dated keys when the
+    batch contains any.
+    """
 
-def _trade_from_dict(t: Dict[str, Any]) -> Trade:
-    """Create a Trade ORM instance from a parsed trade dict."""
+    base = select(*(getattr(Trade, c) for c in _IDENTITY_COLS))
+    existing: set[tuple] = set()
 
-    return Trade(**t)
+    dates = {r.get("transaction_date") for r in rows}
+    has_null_date = None in dates
+    dates.discard(None)
+
+    if dates:
+        stmt = base.where(Trade.transaction_date.in_(dates))
+        existing.update(tuple(row) for row in session.execute(stmt))
+    if has_null_date:
+        null_stmt = base.where(Trade.transaction_date.is_(None))
+        existing.update(tuple(row) for row in session.execute(null_stmt))
+    return existing
+
+
+def _row_from_dict(t: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalise a parsed trade dict into an insertable row dict.
+
+    Derives the persisted ``unusual`` flag here so every ingest path
+    (Senate scraper, Congress API, backfills) gets it without having to
+    compute it themselves.
+    """
 
+    if "unusual" not in t:
+        mid_point = t.get("mid_point")
+        t = {**t, "unusual": bool(mid_point is not None and mid_point > 100_000)}
+    return t
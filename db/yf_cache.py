@@ -0,0 +1,71 @@
+"""Persistent on-disk TTL cache for yfinance ticker-info lookups.
+
+Company/sector/industry data moves on the order of quarters, while the
+enrichment job keeps re-encountering the same tickers across scheduled
+runs. Caching the extracted metadata as small JSON blobs under
+``.cache/yf_info/`` drops the HTTP request count to zero for tickers we
+have already seen, and a shorter negative TTL stops us from hammering
+Yahoo for symbols it simply doesn't know.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class FileCache:
+    """JSON-file TTL cache keyed by ticker symbol.
+
+    Each entry is ``{"fetched_at": <epoch>, "data": {...} | null}``.
+    A ``null`` data payload is a negative-cache entry (the lookup ran
+    and found nothing useful) and expires on its own shorter TTL.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/yf_info",
+        ttl: float = 90 * 86400,
+        negative_ttl: float = 86400,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def _path(self, ticker: str) -> Path:
+        # Tickers are filesystem-safe apart from the occasional slash
+        # (e.g. class shares quoted as BRK/B).
+        return self.cache_dir / f"{ticker.replace('/', '_')}.json"
+
+    def lookup(self, ticker: str) -> Tuple[bool, Optional[dict]]:
+        """Return ``(hit, data)`` for ``ticker``.
+
+        ``(True, {...})`` — fresh positive entry; ``(True, None)`` —
+        fresh negative entry; ``(False, None)`` — missing or expired.
+        """
+
+        path = self._path(ticker)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return False, None
+
+        data = entry.get("data")
+        max_age = self.ttl if data is not None else self.negative_ttl
+        if time.time() - entry.get("fetched_at", 0) >= max_age:
+            return False, None
+        return True, data
+
+    def store(self, ticker: str, data: Optional[dict]) -> None:
+        """Write a cache entry; ``data=None`` records a negative result."""
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"fetched_at": time.time(), "data": data}
+        try:
+            with open(self._path(ticker), "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+        except OSError as exc:  # pragma: no cover - defensive
+            print(f"[yf_cache] failed to write cache entry for {ticker}: {exc}")
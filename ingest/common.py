@@ -54,6 +54,7 @@ def clean_and_upsert(df: pd.DataFrame) -> int:
     df = df.astype(object).replace({np.nan: None, float("inf"): None, float("-inf"): None})
     df = df.where(pd.notnull(df), None)
 
-    # 4. Upsert
-    inserted = upsert_trades(df.to_dict(orient="records"))
+    # 4. Upsert — the frame goes in directly; upsert_trades iterates the
+    #    rows itself without a to_dict('records') materialization.
+    inserted = upsert_trades(df)
     return inserted
@@ -74,9 +74,10 @@ def run_ingest(days: int = 90) -> None:
     df = df.astype(object).replace({np.nan: None, float("inf"): None, float("-inf"): None})
     df = df.where(pd.notnull(df), None)
 
-    trades = df.to_dict(orient="records")
-    inserted = upsert_trades(trades)
-    print(f"Upsert complete. Inserted {inserted} new trades (scraped {len(trades)} total).")
+    # Feed the frame straight into the upsert — it iterates the rows
+    # itself, skipping a full to_dict('records') materialization here.
+    inserted = upsert_trades(df)
+    print(f"Upsert complete. Inserted {inserted} new trades (scraped {len(df)} total).")
     
     # --- UPDATE ALL HISTORICAL PRICES ---
     # Now that we've inserted new trades, update current prices for ALL
@@ -9,10 +9,11 @@ Usage (from project root, with env activated):
 from __future__ import annotations
 
 import argparse
+import csv
 import datetime as dt
 from pathlib import Path
 
-from scraper.pipeline import fetch_ptr_trades_for_range
+from scraper.pipeline import iter_ptr_trades_for_range
 
 
 def main() -> None:
@@ -25,17 +26,30 @@ def main() -> None:
     start_date = today - dt.timedelta(days=args.days)
 
     print(f"Fetching PTR trades filed between {start_date} and {today}...")
-    df = fetch_ptr_trades_for_range(start_date, today)
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if df.empty:
+    # Stream trades straight to disk as each batch of reports completes,
+    # instead of materializing the full range as a DataFrame first —
+    # peak memory stays at one batch regardless of the range size.
+    trades = iter_ptr_trades_for_range(start_date, today)
+    first = next(trades, None)
+    if first is None:
         print("No PTR trades found in this range. Nothing written.")
         return
 
-    df.to_csv(out_path, index=False)
-    print(f"Wrote {len(df)} trades to {out_path}")
+    written = 0
+    with open(out_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(first.keys()))
+        writer.writeheader()
+        writer.writerow(first)
+        written += 1
+        for trade in trades:
+            writer.writerow(trade)
+            written += 1
+
+    print(f"Wrote {written} trades to {out_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""On-disk cache of fetched PTR HTML, keyed by report_id.
+
+Filed PTRs are immutable, so once a report's HTML has been downloaded
+it never needs to be fetched again: repeat scrapes become a gzipped
+disk read instead of a network round trip (and zero load on the eFD
+server). Pages are stored under ``.cache/ptr_html/`` alongside the
+other on-disk caches.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from typing import Optional
+
+_CACHE_DIR = os.path.join(".cache", "ptr_html")
+
+
+def _path(report_id: str) -> str:
+    return os.path.join(_CACHE_DIR, f"{report_id}.html.gz")
+
+
+def load_report_html(report_id: Optional[str]) -> Optional[str]:
+    """Return the cached HTML for ``report_id``, or None on a miss."""
+
+    if not report_id:
+        return None
+    try:
+        with gzip.open(_path(report_id), "rt", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def store_report_html(report_id: Optional[str], html: str) -> None:
+    """Cache ``html`` for ``report_id``; best-effort."""
+
+    if not report_id:
+        return
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with gzip.open(_path(report_id), "wt", encoding="utf-8") as f:
+            f.write(html)
+    except OSError as exc:
+        print(f"[cache] could not cache PTR {report_id}: {exc}")
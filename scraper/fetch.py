@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 import datetime as dt
+import math
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
+
+import orjson
+import requests
+
 from .session import BASE_URL, create_efd_session, default_ajax_headers
 
 REPORT_DATA_URL = f"{BASE_URL}/search/report/data/"
@@ -58,6 +65,13 @@ def _base_datatables_payload() -> Dict[str, Any]:
         "office_id": "",
     }
 
+# The DataTables boilerplate never changes between calls, so build and
+# URL-encode it once at import; each request only encodes its handful of
+# per-call fields and concatenates. Matters when dozens of pages are in
+# flight via the parallel pagination path.
+_BASE_PAYLOAD_ENCODED = urllib.parse.urlencode(_base_datatables_payload())
+
+
 def fetch_reports_page(
     submitted_start_date: dt.date,
     submitted_end_date: dt.date | None = None,
@@ -82,9 +96,10 @@ def fetch_reports_page(
     # 2. Build headers with that token
     headers = default_ajax_headers(csrf)
 
-    # 3. Build payload
-    payload = _base_datatables_payload()
-    payload.update({
+    # 3. Build only the per-call fields and append them to the pre-encoded
+    #    invariant payload; the content-type from default_ajax_headers
+    #    already declares the form encoding.
+    extra = {
         "start": str(start),
         "length": str(length),
         "submitted_start_date": _format_datetime_for_query(submitted_start_date),
@@ -94,16 +109,20 @@ def fetch_reports_page(
         ),
         "first_name": first_name,
         "last_name": last_name,
-    })
+    }
+    body = _BASE_PAYLOAD_ENCODED + "&" + urllib.parse.urlencode(extra)
 
     # 4. Execute POST
-    resp = session.post(REPORT_DATA_URL, data=payload, headers=headers)
+    resp = session.post(REPORT_DATA_URL, data=body, headers=headers)
     
     if resp.status_code == 403:
         print("CRITICAL: Still getting 403. Check if CSRF token is being passed correctly in cookies.")
         
     resp.raise_for_status()
-    return resp.json()
+    # orjson parses the raw bytes directly (no decode step) and is
+    # several times faster than stdlib json on these multi-megabyte
+    # DataTables payloads — noticeable with pages fetched in parallel.
+    return orjson.loads(resp.content)
 
 def fetch_all_reports(
     submitted_start_date: dt.date,
@@ -147,23 +166,43 @@ def fetch_all_reports(
             "data": data,
         }
 
-    # Otherwise, keep pulling more pages until we've got them all.
-    start = page_size
-    while len(data) < records_filtered:
-        page = fetch_reports_page(
-            submitted_start_date=submitted_start_date,
-            submitted_end_date=submitted_end_date,
-            first_name=first_name,
-            last_name=last_name,
-            start=start,
-            length=page_size,
-            session=session,
-        )
-        rows = page.get("data", [])
-        if not rows:
-            break
-        data.extend(rows)
-        start += page_size
+    # Otherwise fetch the remaining pages concurrently: after page 1 the
+    # total is known, so pages 2..N are independent I/O-bound requests.
+    # requests.Session is thread-safe for reads and pools connections.
+    n_pages = math.ceil((records_filtered - page_size) / page_size)
+    starts = [page_size * i for i in range(1, n_pages + 1)]
+
+    def fetch_page_at(start: int) -> Dict[str, Any]:
+        try:
+            return fetch_reports_page(
+                submitted_start_date=submitted_start_date,
+                submitted_end_date=submitted_end_date,
+                first_name=first_name,
+                last_name=last_name,
+                start=start,
+                length=page_size,
+                session=session,
+            )
+        except requests.HTTPError as exc:
+            # A 403 mid-run usually means the CSRF cookie expired; redo
+            # the handshake once and retry just this page.
+            if exc.response is not None and exc.response.status_code == 403:
+                fresh, _ = create_efd_session()
+                return fetch_reports_page(
+                    submitted_start_date=submitted_start_date,
+                    submitted_end_date=submitted_end_date,
+                    first_name=first_name,
+                    last_name=last_name,
+                    start=start,
+                    length=page_size,
+                    session=fresh,
+                )
+            raise
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        # pool.map preserves submission order, so rows stay in page order.
+        for page in pool.map(fetch_page_at, starts):
+            data.extend(page.get("data", []))
 
     return {
         "recordsTotal": first_page.get("recordsTotal", len(data)),
@@ -6,53 +6,210 @@ parsing logic to fetch all PTR trades in a given filing date range.
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
-from typing import Any, Dict, Iterable, List
+import time
+from typing import Any, Dict, Iterable, Iterator, List
 
+import aiohttp
 import pandas as pd
 
+from .cache import load_report_html, store_report_html
 from .fetch import fetch_all_reports
-from .parse import parse_report_rows
-from .ptr_details import fetch_ptr_trades
-from .session import create_efd_session
+from .parse import ReportRow, parse_report_row
+from .ptr_details import parse_ptr_trades_from_html
+from .session import get_shared_session
 
 
-def fetch_ptr_reports_for_range(start_date: dt.date, end_date: dt.date) -> List[Dict[str, Any]]:
+def fetch_ptr_reports_for_range(
+    start_date: dt.date,
+    end_date: dt.date,
+    session=None,
+) -> List[ReportRow]:
     """Fetch all PTR report metadata for filings in [start_date, end_date]."""
 
-    session, _ = create_efd_session()
+    if session is None:
+        session = get_shared_session()
     result = fetch_all_reports(
         submitted_start_date=start_date,
         submitted_end_date=end_date,
         session=session,
     )
 
+    # Parse and filter in one pass over a generator — no intermediate
+    # all-reports list alive alongside the raw rows and the PTR subset.
     rows = result.get("data", [])
-    reports = parse_report_rows(rows)
-
     ptr_reports = [
-        r for r in reports
-        if r.get("is_ptr") and r.get("report_format") == "ptr"
+        r for r in (parse_report_row(row) for row in rows)
+        if r.is_ptr and r.report_format == "ptr"
     ]
     return ptr_reports
 
 
-def fetch_ptr_trades_for_reports(reports: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Fetch and parse trades for a collection of PTR reports."""
+class _RetryAfterGate:
+    """Shared throttle driven by the server's rate-limit responses.
+
+    efd.senate.gov does not publish X-RateLimit-* headers, so the only
+    authoritative signal is a 429's ``Retry-After``. When one worker sees
+    it, the gate pauses *all* workers until the given time — a fixed
+    semaphore alone would keep hammering with the remaining slots and
+    turn one throttle into a batch of full-RTT retries.
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    async def wait(self) -> None:
+        """Block until any server-requested pause has elapsed."""
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def throttle(self, retry_after: float) -> None:
+        """Pause all workers for ``retry_after`` seconds from now."""
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+
+def _retry_after_seconds(resp: aiohttp.ClientResponse, default: float) -> float:
+    """Parse a Retry-After header (seconds form), falling back to ``default``."""
+    try:
+        return max(float(resp.headers.get("Retry-After", "")), 0.0)
+    except ValueError:
+        return default
+
+
+async def _fetch_report_html_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    gate: _RetryAfterGate,
+    report_url: str,
+    max_retries: int = 3,
+) -> str:
+    """GET one report page, with exponential backoff on 429/5xx."""
+
+    backoff = 1.0
+    for attempt in range(max_retries + 1):
+        await gate.wait()
+        async with sem:
+            async with session.get(report_url, allow_redirects=True) as resp:
+                if resp.status == 429:
+                    # Honor the server's requested pause for everyone.
+                    gate.throttle(_retry_after_seconds(resp, default=backoff))
+                elif resp.status in (500, 502, 503, 504) and attempt < max_retries:
+                    pass
+                else:
+                    resp.raise_for_status()
+                    return await resp.text()
+        # Sleep outside the semaphore so a throttled worker doesn't hold a slot.
+        await asyncio.sleep(backoff)
+        backoff *= 2
+    raise RuntimeError(f"Exhausted retries fetching {report_url}")
+
+
+async def fetch_ptr_trades_for_reports_async(
+    reports: Iterable[ReportRow],
+    concurrency: int = 32,
+    sync_session=None,
+) -> List[Dict[str, Any]]:
+    """Fetch and parse trades for many PTR reports concurrently.
+
+    The work is pure network I/O against efd.senate.gov, so the reports
+    are fetched with one shared ``aiohttp`` session (carrying the cookies
+    from the usual agreement handshake) gated by a semaphore, instead of
+    one blocking request at a time. A failed report is logged and skipped
+    so one bad page doesn't sink the whole batch.
+    """
+
+    reports = list(reports)
+    if not reports:
+        return []
+
+    # The agreement handshake stays on requests/BeautifulSoup; only the
+    # resulting cookies are handed to the async session. An
+    # already-authenticated session can be passed in to skip the
+    # handshake entirely.
+    if sync_session is None:
+        sync_session = get_shared_session()
+    headers = dict(sync_session.headers)
+    cookies = sync_session.cookies.get_dict()
+
+    sem = asyncio.Semaphore(concurrency)
+    gate = _RetryAfterGate()
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+    async with aiohttp.ClientSession(
+        connector=connector, headers=headers, cookies=cookies
+    ) as session:
+
+        loop = asyncio.get_running_loop()
+
+        async def fetch_one(report: ReportRow) -> List[Dict[str, Any]]:
+            # Cache reads/writes and the lxml parse run on the default
+            # thread pool so neither disk I/O nor a large transaction
+            # table stalls the event loop (and the other in-flight
+            # fetches) mid-batch.
+            html = await loop.run_in_executor(
+                None, load_report_html, report.report_id
+            )
+            if html is None:
+                html = await _fetch_report_html_async(
+                    session, sem, gate, report.report_url
+                )
+                await loop.run_in_executor(
+                    None, store_report_html, report.report_id, html
+                )
+            return await loop.run_in_executor(
+                None, parse_ptr_trades_from_html, html, report
+            )
+
+        results = await asyncio.gather(
+            *(fetch_one(r) for r in reports), return_exceptions=True
+        )
 
-    session, _ = create_efd_session()
     all_trades: List[Dict[str, Any]] = []
+    for report, result in zip(reports, results):
+        if isinstance(result, BaseException):
+            print(f"[pipeline] failed to fetch {report.report_id}: {result}")
+            continue
+        all_trades.extend(result)
+    return all_trades
 
-    for report in reports:
-        trades = fetch_ptr_trades(report, session=session)
-        all_trades.extend(trades)
 
-    return all_trades
+def fetch_ptr_trades_for_reports(
+    reports: Iterable[ReportRow],
+    session=None,
+) -> List[Dict[str, Any]]:
+    """Fetch and parse trades for a collection of PTR reports."""
+
+    return asyncio.run(
+        fetch_ptr_trades_for_reports_async(reports, sync_session=session)
+    )
+
+
+def iter_ptr_trades_for_range(
+    start_date: dt.date,
+    end_date: dt.date,
+    batch_size: int = 50,
+) -> Iterator[Dict[str, Any]]:
+    """Yield PTR trades for filings in [start_date, end_date] incrementally.
+
+    Reports are fetched concurrently ``batch_size`` at a time and their
+    trades yielded as each batch completes, so consumers (e.g. the CSV
+    dump) hold one batch in memory instead of the whole range. One
+    authenticated session (one CSRF handshake, one warm connection pool)
+    is shared by the report search and every PTR page fetch.
+    """
+
+    session = get_shared_session()
+    reports = fetch_ptr_reports_for_range(start_date, end_date, session=session)
+    for i in range(0, len(reports), batch_size):
+        yield from fetch_ptr_trades_for_reports(
+            reports[i:i + batch_size], session=session
+        )
 
 
 def fetch_ptr_trades_for_range(start_date: dt.date, end_date: dt.date) -> pd.DataFrame:
     """Fetch all PTR trades for filings in [start_date, end_date] as a DataFrame."""
 
-    reports = fetch_ptr_reports_for_range(start_date, end_date)
-    trades = fetch_ptr_trades_for_reports(reports)
-    return pd.DataFrame(trades)
+    return pd.DataFrame(list(iter_ptr_trades_for_range(start_date, end_date)))
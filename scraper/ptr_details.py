@@ -7,27 +7,88 @@ table into a list of normalized trade records.
 
 from __future__ import annotations
 
-import datetime as dt
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern
+from typing import Any, Dict, Iterable, List, Tuple
 
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
-
-from .session import create_efd_session
-from .parse import parse_amount_range, normalize_transaction_type
+from lxml import etree
+
+from .cache import load_report_html, store_report_html
+from .session import get_shared_session
+from .parse import (
+    ReportRow,
+    parse_amount_range_series,
+    normalize_transaction_type_series,
+)
+
+# Compiled once at import and reused for every PTR page: the whole
+# caption match (case-folded via translate, since XPath 1.0 has no
+# lower-case()) runs inside libxml2 instead of a Python loop over every
+# <table>. Parenthesized so [1] picks the first match document-wide.
+_TX_TABLE_XPATH = etree.XPath(
+    "(//table[caption[contains(translate(normalize-space(.),"
+    " 'TRANSACTION', 'transaction'), 'transaction')]])[1]"
+)
+_TABLE_FALLBACK_XPATH = etree.XPath("(//table[contains(@class, 'table')])[1]")
+
+# lxml parsers are stateful and not thread-safe, and PTR parsing runs on
+# worker threads (the async pipeline's executor, fetch_ptr_trades_many),
+# so keep one reusable parser per thread instead of building a fresh one
+# per page. Comments are stripped and id-collection skipped — neither is
+# needed for cell extraction.
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(remove_comments=True, collect_ids=False)
+        _parser_local.parser = parser
+    return parser
+
+
+# Ticker cell values that mark a non-public / unidentifiable asset, and
+# comment cell values that mean "no comment" — module-level so the row
+# loop doesn't rebuild them per iteration.
+_PRIVATE_TICKERS = frozenset(("", "-", "--"))
+_EMPTY_COMMENTS = frozenset(("", "--"))
+
+# Low-cardinality trade columns stored as category dtype in DataFrames:
+# a small integer code per row instead of a full Python string.
+_CATEGORY_COLS = (
+    "senator_name",
+    "senator_first_name",
+    "senator_last_name",
+    "senator_display_name",
+    "chamber",
+    "report_type",
+    "report_format",
+    "owner",
+    "asset_type",
+    "transaction_type",
+    "transaction_type_raw",
+)
 
 
 def fetch_report_html(report_url: str, session=None) -> str:
-    """Fetch the HTML for a single report URL using an authenticated session."""
+    """Fetch the HTML for a single report URL using an authenticated session.
+
+    Defaults to the shared module-level session (one CSRF handshake, a
+    warm keep-alive pool) instead of bootstrapping a fresh session per
+    report.
+    """
 
     if session is None:
-        session, _ = create_efd_session()
+        session = get_shared_session()
     resp = session.get(report_url, allow_redirects=True)
     resp.raise_for_status()
     return resp.text
 
 
-def _find_transactions_table(soup: BeautifulSoup) -> Any:
+def _find_transactions_table(tree: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
     """Locate the Transactions table element in a PTR HTML document.
 
     The HTML you provided shows a structure like::
@@ -43,38 +104,52 @@ def _find_transactions_table(soup: BeautifulSoup) -> Any:
     We search for a <table> whose caption mentions "transactions".
     """
 
-    for table in soup.find_all("table"):
-        caption = table.find("caption")
-        if caption and "transaction" in caption.get_text(strip=True).lower():
-            return table
+    res = _TX_TABLE_XPATH(tree)
+    if res:
+        return res[0]
 
     # Fallback: first striped table
-    table = soup.find("table", class_="table")
-    if table is None:
+    res = _TABLE_FALLBACK_XPATH(tree)
+    if not res:
         raise ValueError("Could not find transactions table in PTR HTML")
-    return table
+    return res[0]
+
+
+def parse_ptr_trades_from_html(html: str, report_meta: ReportRow) -> List[Dict[str, Any]]:
+    """Parse trades from a PTR HTML page given as a string.
+
+    lxml builds the tree in C (libxml2) and is as tolerant of
+    real-world markup as the old bs4/html.parser combination was,
+    several times faster.
+    """
+
+    return parse_ptr_trades_from_tree(
+        lxml.html.fromstring(html, parser=_html_parser()), report_meta
+    )
 
 
-def parse_ptr_trades_from_html(html: str, report_meta: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Parse trades from a PTR HTML page.
+def parse_ptr_trades_from_tree(
+    tree: lxml.html.HtmlElement, report_meta: ReportRow
+) -> List[Dict[str, Any]]:
+    """Parse trades from an already-parsed PTR document tree.
 
-    ``report_meta`` is a dict produced by ``parse_report_row`` and should
-    contain keys like ``senator_first_name``, ``senator_last_name``,
-    ``senator_display_name``, ``report_id``, ``report_type``, and
-    ``filing_date``.
+    ``report_meta`` is the :class:`ReportRow` produced by
+    ``parse_report_row`` for this report.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    table = _find_transactions_table(soup)
+    table = _find_transactions_table(tree)
 
     tbody = table.find("tbody")
     if tbody is None:
         return []
 
-    trades: List[Dict[str, Any]] = []
+    # First pass: pull raw cell text off the tree, keeping the
+    # ticker-link distinction and row skipping that a wholesale
+    # pandas.read_html can't express.
+    rows: List[Tuple] = []
 
-    for tr in tbody.find_all("tr"):
-        tds = tr.find_all("td")
+    for tr in tbody.findall("tr"):
+        tds = tr.findall("td")
         if len(tds) < 9:
             continue
 
@@ -89,78 +164,165 @@ def parse_ptr_trades_from_html(html: str, report_meta: Dict[str, Any]) -> List[D
         # 7: Amount (range string)
         # 8: Comment
 
-        transaction_date_raw = tds[1].get_text(strip=True)
-        owner = tds[2].get_text(strip=True) or None
+        # One pass over the cells instead of nine separate
+        # text_content() call sites.
+        cells = [td.text_content().strip() for td in tds]
 
-        ticker_td = tds[3]
-        ticker_link = ticker_td.find("a")
+        ticker_link = tds[3].find(".//a")
         ticker = (
-            ticker_link.get_text(strip=True)
+            ticker_link.text_content().strip()
             if ticker_link is not None
-            else ticker_td.get_text(strip=True) or None
-        )
-        private_tickers = {"", "-", "--"}
-        if ticker is None or ticker in private_tickers:
+            else cells[3]
+        ) or None
+        if ticker is None or ticker in _PRIVATE_TICKERS:
             # Skip this row entirely – non-public or unidentifiable asset
             continue
 
-        asset_name = tds[4].get_text(strip=True) or None
-        asset_type = tds[5].get_text(strip=True) or None
-        raw_tx_type = tds[6].get_text(strip=True)
-        amount_range_raw = tds[7].get_text(strip=True) or None
-        comment_raw = tds[8].get_text(strip=True)
-        comment = None if comment_raw == "--" or comment_raw == "" else comment_raw
-
-        # Parse date and amount
-        try:
-            transaction_date = dt.datetime.strptime(transaction_date_raw, "%m/%d/%Y").date()
-        except ValueError:
-            # If parsing fails, store raw string and leave date None
-            transaction_date = None
-
-        amount_min, amount_max, mid_point = parse_amount_range(amount_range_raw)
-        transaction_type = normalize_transaction_type(raw_tx_type)
-
-        senator_first = report_meta.get("senator_first_name") or ""
-        senator_last = report_meta.get("senator_last_name") or ""
-        senator_name = f"{senator_first} {senator_last}".strip()
-
-        trade: Dict[str, Any] = {
-            "senator_name": senator_name,
-            "senator_first_name": senator_first,
-            "senator_last_name": senator_last,
-            "senator_display_name": report_meta.get("senator_display_name"),
-            "chamber": report_meta.get("chamber", "Senate"),
-            "report_id": report_meta.get("report_id"),
-            "report_type": report_meta.get("report_type"),
-            "report_format": report_meta.get("report_format"),
-            "filing_date": report_meta.get("filing_date"),
-            "transaction_date": transaction_date,
-            "owner": owner,
-            "ticker": ticker,
-            "asset_name": asset_name,
-            "asset_type": asset_type,
-            "transaction_type": transaction_type,
-            "transaction_type_raw": raw_tx_type,
-            "amount_range_raw": amount_range_raw,
-            "amount_min": amount_min,
-            "amount_max": amount_max,
-            "mid_point": mid_point,
-            "comment": comment,
-        }
+        transaction_date_raw = cells[1]
+        # Owner / asset-type / type labels repeat heavily across rows
+        # and reports; interning collapses them to shared objects.
+        owner = intern(cells[2]) or None
+        asset_name = cells[4] or None
+        asset_type = intern(cells[5]) or None
+        raw_tx_type = intern(cells[6])
+        amount_range_raw = cells[7] or None
+        comment = None if cells[8] in _EMPTY_COMMENTS else cells[8]
+
+        rows.append((
+            transaction_date_raw, owner, ticker, asset_name, asset_type,
+            raw_tx_type, amount_range_raw, comment,
+        ))
+
+        # Drop the row's subtree now that its text is extracted, so a
+        # giant PTR doesn't hold every cell element alive alongside the
+        # accumulating Python rows (iterparse-style incremental release,
+        # without forking a second non-DOM parsing path).
+        tr.clear()
+
+    if not rows:
+        return []
+
+    # Second pass: dates, amount ranges and transaction types across
+    # all rows in one vectorized call each, instead of per-row Python
+    # parsing. cache=True makes repeated date strings (common within a
+    # single PTR) a hash lookup; unparseable dates coerce to None as the
+    # old per-row try/except did.
+    dates = pd.to_datetime(
+        [r[0] for r in rows], format="%m/%d/%Y", errors="coerce", cache=True
+    )
+    transaction_dates = [None if pd.isna(d) else d.date() for d in dates]
+    amounts = parse_amount_range_series(
+        pd.Series([r[6] for r in rows], dtype=object)
+    )
+    amount_mins = _floats_or_none(amounts["amount_min"])
+    amount_maxs = _floats_or_none(amounts["amount_max"])
+    mid_points = _floats_or_none(amounts["mid_point"])
+    tx_types = normalize_transaction_type_series(
+        pd.Series([r[5] for r in rows], dtype=object)
+    )
+    tx_types = [None if pd.isna(v) else v for v in tx_types]
+
+    senator_first = report_meta.senator_first_name or ""
+    senator_last = report_meta.senator_last_name or ""
+
+    # Everything from the report metadata is constant across the whole
+    # PTR, so build it once and copy; dict.copy is a single C call
+    # versus re-entering ten literal keys per row.
+    base: Dict[str, Any] = {
+        "senator_name": f"{senator_first} {senator_last}".strip(),
+        "senator_first_name": senator_first,
+        "senator_last_name": senator_last,
+        "senator_display_name": report_meta.senator_display_name,
+        "chamber": report_meta.chamber,
+        "report_id": report_meta.report_id,
+        "report_type": report_meta.report_type,
+        "report_format": report_meta.report_format,
+        "filing_date": report_meta.filing_date,
+    }
 
+    trades: List[Dict[str, Any]] = []
+    for i, (_, owner, ticker, asset_name, asset_type,
+            raw_tx_type, amount_range_raw, comment) in enumerate(rows):
+        trade = base.copy()
+        trade["transaction_date"] = transaction_dates[i]
+        trade["owner"] = owner
+        trade["ticker"] = ticker
+        trade["asset_name"] = asset_name
+        trade["asset_type"] = asset_type
+        trade["transaction_type"] = tx_types[i]
+        trade["transaction_type_raw"] = raw_tx_type
+        trade["amount_range_raw"] = amount_range_raw
+        trade["amount_min"] = amount_mins[i]
+        trade["amount_max"] = amount_maxs[i]
+        trade["mid_point"] = mid_points[i]
+        trade["comment"] = comment
         trades.append(trade)
 
     return trades
 
 
-def fetch_ptr_trades(report_meta: Dict[str, Any], session=None) -> List[Dict[str, Any]]:
-    report_url = report_meta["report_url"]
-    html = fetch_report_html(report_url, session=session)
+def _floats_or_none(s: pd.Series) -> List[float | None]:
+    """Materialize a float Series as a list with NaN mapped back to None."""
+
+    return [None if pd.isna(v) else float(v) for v in s]
+
+
+def fetch_ptr_trades(report_meta: ReportRow, session=None) -> List[Dict[str, Any]]:
+    # Filed PTRs are immutable — serve repeat scrapes from the on-disk
+    # HTML cache and only hit the network (then cache) on a miss.
+    html = load_report_html(report_meta.report_id)
+    if html is None:
+        html = fetch_report_html(report_meta.report_url, session=session)
+        store_report_html(report_meta.report_id, html)
     return parse_ptr_trades_from_html(html, report_meta)
 
 
+def fetch_ptr_trades_many(
+    report_metas: Iterable[ReportRow],
+    workers: int = 8,
+) -> List[List[Dict[str, Any]]]:
+    """Fetch trades for many reports over a thread pool, in order.
+
+    A synchronous alternative to the asyncio pipeline: requests releases
+    the GIL during socket I/O and lxml during C parsing, so fanning the
+    per-report fetches over threads sharing the pooled session (sized
+    well above the worker count) overlaps most of the network latency.
+    ``ex.map`` preserves input order, one trade list per report.
+    """
+
+    session = get_shared_session()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(
+            lambda meta: fetch_ptr_trades(meta, session=session),
+            report_metas,
+        ))
+
+
 def trades_to_dataframe(trades: List[Dict[str, Any]]) -> pd.DataFrame:
-    """Convert a list of trade dicts to a pandas DataFrame."""
+    """Convert a list of trade dicts to a pandas DataFrame.
+
+    Transposes to column lists first (structure-of-arrays, same pattern
+    as ``reports_to_dataframe``) so pandas allocates each column array
+    once, instead of the hash-per-key row-by-row inference that
+    ``pd.DataFrame(list_of_dicts)`` pays. Amount columns get explicit
+    float64 dtype (None included, so no object-column detour) and the
+    low-cardinality labels become categoricals; everything is cast in
+    one astype with copy=False. String columns deliberately stay on the
+    classic numpy object path — Arrow-backed string inference can
+    transiently allocate far more than the data itself.
+    """
+
+    trades = list(trades)
+    if not trades:
+        return pd.DataFrame()
+
+    columns = list(trades[0].keys())
+    cols = {c: [t.get(c) for t in trades] for c in columns}
+    df = pd.DataFrame(cols, copy=False)
 
-    return pd.DataFrame(trades)
+    dtypes: Dict[str, str] = {
+        c: "float64" for c in ("amount_min", "amount_max", "mid_point")
+        if c in df.columns
+    }
+    dtypes.update({c: "category" for c in _CATEGORY_COLS if c in df.columns})
+    return df.astype(dtypes, copy=False)
@@ -11,31 +11,97 @@ which are then used for subsequent AJAX POST requests.
 
 from __future__ import annotations
 
+import os
+import pickle
+import time
 from typing import Tuple
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 BASE_URL = "https://efdsearch.senate.gov"
 SEARCH_URL = f"{BASE_URL}/search/"
 
+# On-disk copy of the CSRF/agreement cookies so repeated scraper
+# invocations (each a fresh process) skip the two-request handshake.
+# Reused only while younger than the in-process session max age, after
+# which the full handshake runs again.
+_COOKIE_CACHE_PATH = os.path.join(".cache", "efd_cookies.pkl")
+
+
+def _load_cached_cookies(session: requests.Session) -> bool:
+    """Load fresh cached handshake cookies into ``session``, if any."""
+
+    try:
+        if time.time() - os.path.getmtime(_COOKIE_CACHE_PATH) >= _SESSION_MAX_AGE_SECONDS:
+            return False
+        with open(_COOKIE_CACHE_PATH, "rb") as f:
+            cookies = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return False
+
+    if not isinstance(cookies, requests.cookies.RequestsCookieJar) or not cookies.get("csrftoken"):
+        return False
+    session.cookies.update(cookies)
+    return True
+
+
+def _store_cached_cookies(session: requests.Session) -> None:
+    """Persist the handshake cookies for the next process; best-effort."""
+
+    try:
+        os.makedirs(os.path.dirname(_COOKIE_CACHE_PATH), exist_ok=True)
+        with open(_COOKIE_CACHE_PATH, "wb") as f:
+            pickle.dump(session.cookies, f)
+    except OSError as exc:
+        print(f"[session] could not cache eFD cookies: {exc}")
+
 
 def create_efd_session():
     session = requests.Session()
-    
-    # 1. Use a real Browser User-Agent
+
+    # 0. Mount a pooled adapter sized for the parallel pagination / PTR
+    #    fetch paths, so concurrent requests share warm keep-alive
+    #    connections, with transparent retries on throttling responses.
+    #    The eFD endpoints we hit are read-only, so retrying POSTs is safe.
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503],
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    )
+    session.mount("https://", adapter)
+
+    # 1. Use a real Browser User-Agent. Advertise brotli ahead of gzip —
+    #    PTR HTML is highly compressible tabular text, and urllib3
+    #    decodes br transparently once the brotli package is installed.
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Referer': 'https://efdsearch.senate.gov/search/home/'
+        'Referer': 'https://efdsearch.senate.gov/search/home/',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Encoding': 'br, gzip, deflate',
     })
 
-    # 2. Visit the home page to get the CSRF token
+    # 2. Reuse recently-cached handshake cookies when available — saves
+    #    the home-page GET + agreement POST on every cold start.
+    if _load_cached_cookies(session):
+        return session, None
+
+    # Otherwise visit the home page to get the CSRF token
     home_url = "https://efdsearch.senate.gov/search/home/"
     response = session.get(home_url)
     
     # 3. Extract the CSRF token from the page
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # lxml backend: tree building runs in C instead of pure-Python
+    # html.parser.
+    soup = BeautifulSoup(response.text, 'lxml')
     csrf_token = soup.find('input', {'name': 'csrfmiddlewaretoken'})
     
     if csrf_token:
@@ -47,10 +113,38 @@ def create_efd_session():
             'prohibition_agreement': '1',
         }
         session.post(home_url, data=payload)
-    
+        _store_cached_cookies(session)
+
     return session, None
 
 
+# Process-wide shared session so scheduled jobs running several scrapes
+# per process (e.g. Azure Functions) bootstrap the CSRF handshake once
+# and keep TCP/TLS connections warm across invocations. Refreshed every
+# 30 minutes in case the CSRF cookie expires server-side.
+_SESSION: requests.Session | None = None
+_SESSION_CREATED_AT: float = 0.0
+_SESSION_MAX_AGE_SECONDS = 30 * 60
+
+
+def get_shared_session() -> requests.Session:
+    """Return the lazily-bootstrapped module-level eFD session.
+
+    Creates (and CSRF-bootstraps) the session on first use, then reuses
+    it until it is older than 30 minutes, at which point the handshake
+    is redone on a fresh session.
+    """
+
+    global _SESSION, _SESSION_CREATED_AT
+
+    if _SESSION is None or time.time() - _SESSION_CREATED_AT >= _SESSION_MAX_AGE_SECONDS:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION, _ = create_efd_session()
+        _SESSION_CREATED_AT = time.time()
+    return _SESSION
+
+
 def default_ajax_headers(csrf_token: str) -> dict:
     """Returns headers that mirror the browser's AJAX request."""
     return {
@@ -29,7 +29,7 @@ def main() -> None:
     # Pick the first PTR report
     ptr_reports = [
         r for r in reports
-        if r.get("is_ptr") and r.get("report_format") == "ptr"
+        if r.is_ptr and r.report_format == "ptr"
     ]
     if not ptr_reports:
         print("No PTR reports found in this date range.")
@@ -38,11 +38,11 @@ def main() -> None:
     report = ptr_reports[0]
     print(
         "Using PTR:",
-        report["filing_date"],
+        report.filing_date,
         "|",
-        report["senator_display_name"],
+        report.senator_display_name,
         "|",
-        report["report_url"],
+        report.report_url,
     )
 
     trades = fetch_ptr_trades(report)
@@ -30,8 +30,8 @@ def main() -> None:
     print("First few parsed reports:")
     for r in reports[:5]:
         print(
-            f"{r['filing_date']} | {r['senator_display_name']} | "
-            f"{r['report_type']} | {r['report_url']}"
+            f"{r.filing_date} | {r.senator_display_name} | "
+            f"{r.report_type} | {r.report_url}"
         )
 
 